@@ -1,7 +1,74 @@
+import math
+
 import numpy as np
 
+try:
+    from numba import njit, prange
+except ImportError:  # Numba is optional, fall back to NumPy.
+    njit = None
+
+
+if njit is not None:
 
-def calculate_nrmsd(observed: np.array, predicted: np.array, N_fit: np.array):
+    @njit(
+        parallel=True, fastmath={"reassoc", "contract"}, error_model="numpy", cache=True
+    )
+    def _nrmsd_kernel(observed, predicted, N_fit, out):
+        # Per-pixel sqrt of the sum of squared residuals, excluding lag 0,
+        # scaled by N_fit in the same pass.
+        n, m, t = observed.shape
+        for i in prange(n):
+            for j in range(m):
+                acc = 0.0
+                for k in range(1, t):
+                    d = observed[i, j, k] - predicted[i, j, k]
+                    acc += d * d
+                out[i, j] = math.sqrt(acc) * N_fit[i, j]
+
+    @njit(
+        parallel=True, fastmath={"reassoc", "contract"}, error_model="numpy", cache=True
+    )
+    def _snr_kernel(cf, start, stop, out):
+        # Per-pixel mean / std (ddof=0) over lags [start, stop), two-pass.
+        n, m, _ = cf.shape
+        size = stop - start
+        for i in prange(n):
+            for j in range(m):
+                acc = 0.0
+                for k in range(start, stop):
+                    acc += cf[i, j, k]
+                mean = acc / size
+                acc = 0.0
+                for k in range(start, stop):
+                    d = cf[i, j, k] - mean
+                    acc += d * d
+                out[i, j] = mean / math.sqrt(acc / size)
+
+
+def _collapse_leading(arr: np.array, ndim: int):
+    # Merge leading axes so the (n, m, t) kernels also serve batched input.
+    return arr.reshape(-1, *arr.shape[arr.ndim - ndim + 1 :])
+
+
+def _get_out(out: np.array, shape: tuple, dtype):
+    # Result array: a new one, or the caller's ``out`` (e.g., reused across ROI
+    # updates). Must be C-contiguous so the kernels write into it, not a copy.
+    if out is None:
+        return np.empty(shape, dtype=dtype)
+    if out.shape != shape:
+        raise ValueError(f"out must have shape {shape}, got {out.shape}.")
+    if not out.flags.c_contiguous:
+        raise ValueError("out must be C-contiguous.")
+    return out
+
+
+def calculate_nrmsd(
+    observed: np.array,
+    predicted: np.array,
+    N_fit: np.array,
+    high_precision: bool = False,
+    out: np.array = None,
+):
     """
     Compute the normalized root-mean-square deviation (NRMSD) between
     observed and predicted correlation curves.
@@ -13,17 +80,28 @@ def calculate_nrmsd(observed: np.array, predicted: np.array, N_fit: np.array):
         - ``n`` is the number of rows,
         - ``m`` is the number of columns,
         - ``t`` is the number of lag times.
+        Leading axes are also accepted, e.g. ``(num_cells, n, m, t)`` to
+        process several cells in a single call.
     predicted : numpy.ndarray
-        3D array of predicted values with the same shape as ``observed``.
+        Array of predicted values with the same shape as ``observed``.
     N_fit : numpy.ndarray
-        2D array of normalization factors with shape ``(n, m)``.
+        Array of normalization factors with shape ``(n, m)`` (or the leading
+        shape of ``observed`` without ``t``).
         Each value corresponds to the estimated particle number ``N`` at each pixel.
+    high_precision : bool, optional
+        If ``True``, read the inputs and return the result in the input
+        precision. By default they are read as ``float32``, which halves memory
+        traffic. Sums are always accumulated in ``float64``.
+    out : numpy.ndarray, optional
+        C-contiguous array of shape ``observed.shape[:-1]`` to write the result
+        into instead of allocating a new one.
 
     Returns
     -------
     numpy.ndarray
         2D array of NRMSD values with shape ``(n, m)``, where each element
-        represents the NRMSD for the corresponding pixel.
+        represents the NRMSD for the corresponding pixel (``observed.shape[:-1]``
+        for batched input).
 
     Notes
     -----
@@ -35,20 +113,45 @@ def calculate_nrmsd(observed: np.array, predicted: np.array, N_fit: np.array):
     Raises
     ------
     ValueError
-        If ``observed`` and ``predicted`` do not have matching shapes.
+        If ``observed`` and ``predicted`` do not have matching shapes, or
+        ``out`` does not match the result.
     """
 
     if observed.shape != predicted.shape:
         raise ValueError("Observed and predicted arrays must have the same shape.")
 
-    # Calculate residuals, square them, and take the mean along the last axis (t).
-    # Exclude time lag = 0.
-    residuals_squared_mean = np.sum(
-        (observed[:, :, 1:] - predicted[:, :, 1:]) ** 2, axis=2
+    if not high_precision:
+        observed = observed.astype(np.float32, copy=False)
+        predicted = predicted.astype(np.float32, copy=False)
+
+    rmsd_matrix = _get_out(out, observed.shape[:-1], observed.dtype)
+
+    if njit is not None:
+        # Stream each pixel's residual once and normalise, in parallel over rows.
+        _nrmsd_kernel(
+            _collapse_leading(observed, 3),
+            _collapse_leading(predicted, 3),
+            _collapse_leading(np.broadcast_to(N_fit, rmsd_matrix.shape), 2),
+            _collapse_leading(rmsd_matrix, 2),
+        )
+        return rmsd_matrix
+
+    # Calculate residuals and take their Euclidean norm along the last axis
+    # (t). Exclude time lag = 0.
+    # np.subtract allocates a C-contiguous result even for strided inputs
+    # (e.g., ROI slices), so the reduction runs over a contiguous last axis.
+    # einsum sums the squares without a second (n, m, t) temporary, accumulating
+    # in float64 like the Numba kernel.
+    residuals = np.subtract(observed[..., 1:], predicted[..., 1:])
+    np.einsum(
+        "...k,...k->...",
+        residuals,
+        residuals,
+        out=rmsd_matrix,
+        dtype=np.float64,
+        casting="same_kind",
     )
-
-    # Compute the square root of the mean residuals to get RMSD.
-    rmsd_matrix = np.sqrt(residuals_squared_mean)
+    np.sqrt(rmsd_matrix, out=rmsd_matrix)
 
     # Normalisation.
     rmsd_matrix *= N_fit
@@ -56,7 +159,9 @@ def calculate_nrmsd(observed: np.array, predicted: np.array, N_fit: np.array):
     return rmsd_matrix
 
 
-def calculate_snr(cf: np.array, last_lag: int = 6):
+def calculate_snr(
+    cf: np.array, last_lag: int = 6, high_precision: bool = False, out: np.array = None
+):
     """
     Compute the signal-to-noise ratio (SNR) of an autocorrelation function (ACF)
     for each pixel using vectorized operations.
@@ -68,15 +173,24 @@ def calculate_snr(cf: np.array, last_lag: int = 6):
         - ``n`` : number of rows (pixels along axis 0)
         - ``m`` : number of columns (pixels along axis 1)
         - ``t`` : number of lag times
+        Leading axes are also accepted, e.g. ``(num_cells, n, m, t)``.
     last_lag : int, optional
-        Number of initial lag times (starting from lag index 1) used for
-        computing the SNR. Default is ``6``, meaning lag times ``1`` to ``5``
+        Last lag time index (inclusive, starting from lag index 1) used for
+        computing the SNR. Default is ``6``, meaning lag times ``1`` to ``6``
         are included.
+    high_precision : bool, optional
+        If ``True``, read the input and return the result in the input
+        precision instead of ``float32``. The mean and standard deviation are
+        always accumulated in ``float64``.
+    out : numpy.ndarray, optional
+        C-contiguous array of shape ``cf.shape[:-1]`` to write the result into
+        instead of allocating a new one.
 
     Returns
     -------
     numpy.ndarray
-        2D array of shape ``(n, m)`` containing the SNR for each pixel.
+        2D array of shape ``(n, m)`` containing the SNR for each pixel
+        (``cf.shape[:-1]`` for batched input).
 
     Notes
     -----
@@ -86,18 +200,38 @@ def calculate_snr(cf: np.array, last_lag: int = 6):
 
       ``SNR = mean(cf[lag 1 : lag N]) / std(cf[lag 1 : lag N])``
 
+      with ``N = last_lag`` included.
+
     - Division by zero will produce ``inf`` or ``nan`` in accordance with
       NumPy's broadcasting rules.
 
     Raises
     ------
     ValueError
-        If ``last_lag`` is less than or equal to 1.
+        If ``last_lag`` is less than or equal to 1, or ``out`` does not match
+        the result.
     """
 
-    mean = np.mean(cf[:, :, 1:last_lag], axis=2)
-    std = np.std(cf[:, :, 1:last_lag], axis=2)
+    if last_lag <= 1:
+        raise ValueError("last_lag must be greater than 1.")
+
+    if not high_precision:
+        cf = cf.astype(np.float32, copy=False)
+
+    snr = _get_out(out, cf.shape[:-1], cf.dtype)
+
+    if njit is not None:
+        stop = min(last_lag + 1, cf.shape[-1])
+        _snr_kernel(_collapse_leading(cf, 3), 1, stop, _collapse_leading(snr, 2))
+        return snr
+
+    # Lags 1 to last_lag (inclusive). The window is copied once to float64, a
+    # contiguous last axis for both reductions, and the std is two-pass: the
+    # one-pass E[x^2] - E[x]^2 cancels to 0 for high-SNR curves (mean >> std).
+    window = cf[..., 1 : last_lag + 1].astype(np.float64)
+    mean = window.mean(axis=-1)
+    std = window.std(axis=-1)
 
-    snr = np.divide(mean, std)
+    np.divide(mean, std, out=snr)
 
     return snr
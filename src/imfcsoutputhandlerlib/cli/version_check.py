@@ -1,9 +1,10 @@
-from importlib.metadata import metadata, version
+from importlib.metadata import metadata
 
 
 def main() -> None:
     lib_name = "imfcsoutputhandlerlib"
-    print(f"Running {metadata(lib_name)['Name']} v{version(lib_name)}")
+    meta = metadata(lib_name)  # Single dist-info lookup for name and version.
+    print(f"Running {meta['Name']} v{meta['Version']}")
 
 
 if __name__ == "__main__":
@@ -1,7 +1,14 @@
+import copy
+import logging
 import os
 import pickle
+from concurrent.futures import ThreadPoolExecutor
 
-from .image_info import ImageInfo
+import numpy as np
+
+from .image_info import ImageInfo, pickle_arrays
+
+logger = logging.getLogger(__name__)
 
 
 class AllImage:
@@ -12,16 +19,52 @@ class AllImage:
     experiment_name: str
     list_image_info_object: list[ImageInfo]
     grouped_files: dict
+    _by_key: dict[str, ImageInfo]  # Index of ``list_image_info_object`` by key.
+    # Stacked all-cell arrays with the cell versions they were stacked from, see
+    # ``core.image_queries``.
+    _aggregate_cache: dict
+
+    __slots__ = (
+        "experiment_name",
+        "list_image_info_object",
+        "grouped_files",
+        "_by_key",
+        "_aggregate_cache",
+    )
+
+    # Defaults for attributes missing from older pickled versions.
+    _DEFAULTS = {
+        "grouped_files": {},
+        "list_image_info_object": [],
+        "experiment_name": "Unknown Experiment",
+        "_aggregate_cache": {},
+    }
+
+    # Excel-derived arrays stored as views into one all-cell array by ``consolidate``.
+    _SOA_ATTRS = ("lagtimes", "acf1", "sd1", "fit1", "fit1_results")
 
-    def __init__(self, experiment_name: str, group_files: dict):
+    def __init__(
+        self,
+        experiment_name: str,
+        group_files: dict,
+        input_folder: str = None,
+        preload: bool = False,
+        max_workers: int = None,
+    ):
         self.experiment_name = experiment_name
         self.grouped_files = group_files
         self.list_image_info_object = []
 
         for index, (key, value) in enumerate(self.grouped_files.items()):
-            im = ImageInfo(key=key, associated_files=value)
+            im = ImageInfo(key=key, associated_files=value, input_folder=input_folder)
             self.list_image_info_object.append(im)
 
+        self._by_key = {im.key: im for im in self.list_image_info_object}
+        self._aggregate_cache = {}
+
+        if preload:
+            self.preload(input_folder=input_folder, max_workers=max_workers)
+
         print(f"Total files: {len(self.list_image_info_object)}")
 
     # TODO: Handling Missing or Changed Methods.
@@ -30,37 +73,126 @@ class AllImage:
         Restore object state during unpickling,
         including fallback handling for missing attributes or methods from older versions.
         """
-        self.__dict__.update(state)
+        for name in self.__slots__:
+            if name in state:
+                setattr(self, name, state[name])
+            elif name in self._DEFAULTS:
+                setattr(self, name, copy.copy(self._DEFAULTS[name]))
+                logger.debug("Missing '%s'. Initialized to default.", name)
+
+        # Rebuild the key index (not present in older pickles).
+        if "_by_key" not in state:
+            self._by_key = {im.key: im for im in self.list_image_info_object}
 
-        # Handle missing methods by adding defaults.
-        if not hasattr(self, "new_method"):
-            self.new_method = self._default_new_method
-            print("Missing 'new_method'. Added default implementation.")
+    def append(self, obj):
+        self.list_image_info_object.append(obj)
+        self._by_key[obj.key] = obj
+        self.clear_aggregate_cache()
 
-        if not hasattr(self, "grouped_files"):
-            self.grouped_files = {}
-            print("Missing 'grouped_files'. Initialized empty.")
+    def clear_aggregate_cache(self):
+        """
+        Drop the cached all-cell arrays so they are stacked again on next access.
+        """
+        self._aggregate_cache.clear()
 
-        if not hasattr(self, "list_image_info_object"):
-            self.list_image_info_object = []
-            print("Missing 'list_image_info_object'. Initialized empty.")
+    def _get_versions(self) -> tuple:
+        return tuple(im._version for im in self.list_image_info_object)
 
-        if not hasattr(self, "experiment_name"):  # Fix potential typos.
-            self.experiment_name = "Unknown Experiment"
-            print("Missing 'experiment_name'. Initialized 'Unknown Experiment'.")
+    def _get_aggregate(self, var: str):
+        # Cached all-cell array of ``var``, or None if it is missing or a cell's
+        # arrays were loaded or set since it was stacked. ``ImageInfo`` has no
+        # reference to its ``AllImage``, so staleness is checked here.
+        entry = self._aggregate_cache.get(var)
+        if entry is None:
+            return None
+        versions, arr_all_cell = entry
+        if versions != self._get_versions():
+            self._aggregate_cache.pop(var, None)
+            return None
+        return arr_all_cell
 
-    def append(self, obj):
-        self.list_image_info_object.append(obj)
+    def _set_aggregate(self, var: str, arr_all_cell: np.ndarray):
+        self._aggregate_cache[var] = (self._get_versions(), arr_all_cell)
 
     # Searching for an object by key.
     def get_image_info(self, key):
         """
         Retrieve an ``ImageInfo`` object by its key.
         """
+        return self._by_key.get(key)
+
+    def set_input_folder(self, input_folder: str):
+        """
+        Set the folder from which every ``ImageInfo`` lazily loads its data.
+        """
         for image in self.list_image_info_object:
-            if image.key == key:
-                return image
-        return None
+            image.input_folder = input_folder
+        self.clear_aggregate_cache()
+
+    def preload(self, input_folder: str, max_workers: int = None):
+        """
+        Load the Excel data and average intensity of every ``ImageInfo``
+        concurrently.
+
+        Parameters
+        ----------
+        input_folder : str
+            Path to the folder containing the associated Excel and TIFF files.
+        max_workers : int, optional
+            Number of loader threads. Defaults to ``os.cpu_count()``.
+        """
+        if max_workers is None:
+            max_workers = os.cpu_count()
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Consume the iterator so exceptions from workers are raised here.
+            list(
+                executor.map(
+                    lambda im: im.read_excel_df_and_avr_int(input_folder=input_folder),
+                    self.list_image_info_object,
+                )
+            )
+        self.consolidate()
+
+    def consolidate(self):
+        """
+        Store the Excel-derived arrays of all ``ImageInfo`` objects in one
+        all-cell array per variable, each ``ImageInfo`` keeping a view into it.
+
+        The all-cell queries of ``core.image_queries`` then return these arrays
+        without copying. Variables whose shape differs between files are left
+        per cell. Unloaded arrays are loaded first.
+
+        The all-cell arrays and the per-cell views are read-only, use ``.copy()``
+        before modifying them in place.
+        """
+        self.clear_aggregate_cache()
+        if not self.list_image_info_object:
+            return
+
+        list_arrays = [im.get_excel_arrays() for im in self.list_image_info_object]
+        stacked = {}
+        for var in self._SOA_ATTRS:
+            try:
+                arr_all_cell = np.stack([arrays[var] for arrays in list_arrays])
+            except ValueError:
+                logger.debug("'%s' differs in shape between files, not stacked.", var)
+                continue
+
+            # Views inherit the flag, so the per-cell arrays are read-only too.
+            arr_all_cell.flags.writeable = False
+
+            # Rebind one variable at a time so the per-cell arrays can be freed.
+            for im, arrays, view in zip(
+                self.list_image_info_object, list_arrays, arr_all_cell
+            ):
+                arrays[var] = view
+                im.set_excel_arrays(arrays)
+            stacked[var] = arr_all_cell
+
+        # Cached once every cell is rebound, with the final cell versions.
+        for var, arr_all_cell in stacked.items():
+            self._set_aggregate(var, arr_all_cell)
 
     def get_list_of_image(self):
         return self.list_image_info_object
@@ -74,17 +206,47 @@ class AllImage:
     def __len__(self):
         return len(self.list_image_info_object)
 
+    def __getstate__(self):
+        # The aggregate cache is derived data, rebuilt lazily after loading.
+        return {
+            name: getattr(self, name)
+            for name in self.__slots__
+            if name != "_aggregate_cache"
+        }
+
     def save(self, filename: str):
-        """Save the object to a pickle file."""
+        """
+        Save the object to a pickle file.
+
+        The loaded arrays of each ``ImageInfo`` are not saved, they are read
+        again from the input folder on first access. Use ``save_with_arrays``
+        to store them as well.
+        """
+        # Protocol 5 (PEP 574) pickles NumPy arrays without intermediate copies
+        # and has no 4 GiB limit on a single array.
         with open(filename, "wb") as f:
-            pickle.dump(self, f)
+            pickle.dump(self, f, protocol=pickle.HIGHEST_PROTOCOL)
         print(f"Object saved to {filename}")
 
+    def save_with_arrays(self, filename: str):
+        """
+        Save the object to a pickle file, including the loaded ``ImageInfo``
+        arrays, e.g. when the source files will not be available later.
+        """
+        token = pickle_arrays.set(True)
+        try:
+            self.save(filename)
+        finally:
+            pickle_arrays.reset(token)
+
     # TODO: New Default Method for Backward Compatibility.
     def _default_new_method(self):
         """Default implementation of a new method in case an old pickled object lacks it."""
         print("This is a default implementation for a missing method.")
 
+    # Missing methods of older pickled objects are resolved on the class.
+    new_method = _default_new_method
+
     @classmethod
     def from_pickle(cls, filename: str):
         """Load the object safely from a pickle file, handling missing attributes."""
@@ -1,18 +1,37 @@
+import contextvars
+import json
+import logging
 import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 
 import numpy as np
-import tifffile
 
 from ..io import (
-    get_cfs,
+    get_cfs_stack,
     get_fit_param,
     get_fit_results,
     get_lagtimes,
     get_param,
+    read_array_cache,
+    read_avr_intensity,
     read_excel_imfcs_saved,
+    write_array_cache,
 )
 from ..utils import filename_utils
 
+logger = logging.getLogger(__name__)
+
+# Scales the fitted diffusion coefficient D from m^2/s to um^2/s.
+_SCALE_D = np.float32(1e12)
+
+# Reads ``*_AVR.tif`` files in the background while the workbook is parsed.
+_TIFF_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="imfcs-tiff")
+
+# Whether pickling stores the loaded arrays (see ``AllImage.save_with_arrays``).
+# Context-local, so a ``save`` running in another thread is not affected.
+pickle_arrays = contextvars.ContextVar("pickle_arrays", default=False)
+
 
 class ImageInfo:
     """
@@ -24,6 +43,9 @@ class ImageInfo:
         Identifier associated with this image entry (e.g., basename of a file group).
     associated_files : list of str
         List of file paths associated with this image/key.
+    input_folder : str, optional
+        Folder containing ``associated_files``. Required for the lazily loaded
+        array attributes below to be read from disk on first access.
 
     Attributes
     ----------
@@ -52,6 +74,12 @@ class ImageInfo:
     is_excel_data_and_avr_intensity_loaded : bool
         Flag indicating whether Excel-derived data and average intensity have
         been loaded from disk.
+
+    Notes
+    -----
+    The array attributes are loaded lazily: the Excel-derived arrays are parsed
+    together on first access to any of them, and ``avr_intensity`` is read
+    separately from the TIFF file on first access.
     """
 
     rect_coordinates: dict
@@ -59,26 +87,102 @@ class ImageInfo:
 
     key: str
     associated_files: list[str]
+    input_folder: str
 
-    lagtimes: np.array
-    acf1: np.array
-    sd1: np.array
-    fit1: np.array
-    fit1_param: np.array
-    fit1_results: np.array
+    _lagtimes: np.array
+    _acf1: np.array
+    _sd1: np.array
+    _fit1: np.array
+    _fit1_param: np.array
+    _fit1_results: np.array
 
-    avr_intensity: np.array
+    _avr_intensity: np.array
 
     is_excel_data_and_avr_intensity_loaded: bool
 
-    def __init__(self, key: str, associated_files: list[str]):
+    _lock: threading.Lock  # Guards lazy loading, not pickled.
+    _version: int  # Counts loads and sets of the arrays, not pickled.
+
+    __slots__ = (
+        "rect_coordinates",
+        "is_roi_selected",
+        "key",
+        "associated_files",
+        "input_folder",
+        "_lagtimes",
+        "_acf1",
+        "_sd1",
+        "_fit1",
+        "_fit1_param",
+        "_fit1_results",
+        "_avr_intensity",
+        "is_excel_data_and_avr_intensity_loaded",
+        "_lock",
+        "_version",
+    )
+
+    # Lazily loaded attributes, grouped by the file they are read from.
+    _EXCEL_ATTRS = ("lagtimes", "acf1", "sd1", "fit1", "fit1_param", "fit1_results")
+    _AVR_ATTRS = ("avr_intensity",)
+
+    # Arrays in the Excel sidecar cache. ``fit1_param`` (the header cells of the
+    # fit parameter sheet) is stored as JSON text, which keeps their types.
+    _CACHE_NAMES = (
+        "lagtimes",
+        "acf1",
+        "sd1",
+        "fit1",
+        "fit1_param_json",
+        "fit1_results",
+    )
+
+    # Names served by ``get_variable``: the public slots and the lazy arrays.
+    _VARIABLES = frozenset(
+        tuple(name for name in __slots__ if not name.startswith("_"))
+        + _EXCEL_ATTRS
+        + _AVR_ATTRS
+    )
+
+    # Defaults for attributes missing from older pickled versions. Missing arrays
+    # are left unloaded and read on first access.
+    _DEFAULTS = {
+        "input_folder": None,
+        "rect_coordinates": None,
+        "is_roi_selected": False,
+        "is_excel_data_and_avr_intensity_loaded": False,
+        **dict.fromkeys(f"_{attr}" for attr in _EXCEL_ATTRS + _AVR_ATTRS),
+    }
+
+    def __init__(self, key: str, associated_files: list[str], input_folder: str = None):
         self.key = key
         self.associated_files = associated_files
+        self.input_folder = input_folder
         self.rect_coordinates = None
         self.is_roi_selected = None
         self.is_excel_data_and_avr_intensity_loaded = (
             False  # TODO: change when loading database from json.
         )
+        for attr in self._EXCEL_ATTRS + self._AVR_ATTRS:
+            setattr(self, f"_{attr}", None)
+        self._lock = threading.Lock()
+        self._version = 0
+
+    def __getstate__(self):
+        # By default only the small metadata is pickled; the arrays are already
+        # on disk and are reloaded lazily from ``input_folder`` after unpickling.
+        with_arrays = pickle_arrays.get()
+        skip = {"_lock", "_version"}
+        if not with_arrays:
+            skip.update(f"_{attr}" for attr in self._EXCEL_ATTRS + self._AVR_ATTRS)
+
+        state = {
+            name: getattr(self, name)
+            for name in self.__slots__
+            if name not in skip and hasattr(self, name)
+        }
+        if not with_arrays:
+            state["is_excel_data_and_avr_intensity_loaded"] = False
+        return state
 
     # Handle Backward Compatibility for Pickled Objects.
     def __setstate__(self, state):
@@ -86,36 +190,29 @@ class ImageInfo:
         Called when unpickling to ensure all required attributes exist.
         Automatically handles missing attributes in older pickled versions.
         """
-        self.__dict__.update(state)
-
-        # Handle missing attributes (assign default values).
-        if "rect_coordinates" not in state:
-            self.rect_coordinates = None
-            print("Missing 'rect_coordinates'. Initialized to None.")
-
-        if "is_roi_selected" not in state:
-            self.is_roi_selected = False
-            print("Missing 'is_roi_selected'. Initialized to False.")
-
-        if "is_excel_data_and_avr_intensity_loaded" not in state:
+        # Older pickles store the large NumPy attributes without the leading
+        # underscore.
+        state = {
+            (f"_{name}" if name in self._EXCEL_ATTRS + self._AVR_ATTRS else name): value
+            for name, value in state.items()
+        }
+        for name in self.__slots__:
+            if name in state:
+                setattr(self, name, state[name])
+            elif name in self._DEFAULTS:
+                setattr(self, name, self._DEFAULTS[name])
+                logger.debug("Missing '%s'. Initialized to default.", name)
+        self._lock = threading.Lock()
+        self._version = 0
+
+        # Older versions stored unloaded arrays as empty placeholders.
+        for attr in self._EXCEL_ATTRS + self._AVR_ATTRS:
+            value = getattr(self, f"_{attr}")
+            if isinstance(value, np.ndarray) and value.size == 0:
+                setattr(self, f"_{attr}", None)
+
+        if self._acf1 is None or self._avr_intensity is None:
             self.is_excel_data_and_avr_intensity_loaded = False
-            print(
-                "Missing 'is_excel_data_and_avr_intensity_loaded'. Initialized to False."
-            )
-
-        # Handle missing large NumPy attributes.
-        for attr in [
-            "lagtimes",
-            "acf1",
-            "sd1",
-            "fit1",
-            "fit1_param",
-            "fit1_results",
-            "avr_intensity",
-        ]:
-            if attr not in state:
-                setattr(self, attr, np.array([]))  # Default to an empty NumPy array.
-                print(f"Missing '{attr}'. Initialized to empty NumPy array.")
 
     def add_coordinates(self, coordinate: dict):
 
@@ -175,17 +272,9 @@ class ImageInfo:
             and the main Excel file (``*.xlsx`` but not ``*_metadata.xlsx``).
         """
 
-        filtered = []
-        associated_files = self.get_files_for_key(key)
-        for filename in associated_files:
-            if filename.endswith("_AVR.tif") or (
-                filename.endswith(".xlsx") and not filename.endswith("_metadata.xlsx")
-            ):
-                filtered.append(filename)
-
-        sorted_files = sorted(filtered, key=lambda x: (not x.endswith(".tif"), x))
-
-        return sorted_files
+        return filename_utils.get_sorted_useful_filenames(
+            input_list=self.associated_files
+        )
 
     def read_excel_df_and_avr_int(self, input_folder: str):
         """
@@ -204,24 +293,66 @@ class ImageInfo:
 
           ``lagtimes``, ``acf1``, ``sd1``, ``fit1``, ``fit1_param``,
           ``fit1_results``, and ``avr_intensity``.
+        - Each attribute is otherwise loaded on first access; this method
+          preloads all of them at once.
         """
 
         if not self.is_excel_data_and_avr_intensity_loaded:
+            self.input_folder = input_folder
+            # tifffile releases the GIL, overlap the TIFF read with the Excel parse.
+            tiff_future = _TIFF_POOL.submit(read_avr_intensity, self._get_path(".tif"))
+            self._load_excel(force=True)
+            self._load_avr_intensity(force=True, prefetch=tiff_future)
+
+    def _get_path(self, suffix: str) -> str:
+        # Sort .tif and .xlsx file.
+        sorted_files = filename_utils.get_sorted_useful_filenames(
+            input_list=self.associated_files
+        )
 
-            # Sort .tif and .xlsx file.
-            sorted_files = filename_utils.get_sorted_useful_filenames(
-                input_list=self.associated_files
+        # Expect exactly one match, without building the list of matches.
+        matches = (file for file in sorted_files if file.endswith(suffix))
+        filename = next(matches, None)
+        assert filename is not None, f"no {suffix} file"
+        assert next(matches, None) is None, f"multiple {suffix} files"
+        return os.path.join(self.input_folder, filename)
+
+    def _check_input_folder(self, attr: str):
+        if self.input_folder is None:
+            raise AttributeError(
+                f"'{type(self).__name__}' object attribute '{attr}' has not been loaded"
             )
 
-            excel_filename = [file for file in sorted_files if file.endswith(".xlsx")]
-            assert len(excel_filename) == 1, "multiple .xlsx files"
-            path_excel = os.path.join(input_folder, excel_filename[0])
+    def _update_loaded_flag(self):
+        # Called whenever arrays are loaded or set. The new version tells
+        # ``AllImage`` that its stacked all-cell arrays are stale.
+        self._version += 1
+        self.is_excel_data_and_avr_intensity_loaded = (
+            self._acf1 is not None and self._avr_intensity is not None
+        )
 
-            avr_intensity_filename = [
-                file for file in sorted_files if file.endswith(".tif")
-            ]
-            assert len(avr_intensity_filename) == 1, "multiple .tif files"
-            path_avr_intensity = os.path.join(input_folder, avr_intensity_filename[0])
+    def _load_excel(self, force: bool = False):
+        """
+        Parse the Excel file and populate ``lagtimes``, ``acf1``, ``sd1``,
+        ``fit1``, ``fit1_param`` and ``fit1_results``.
+        """
+        with self._lock:
+            if self._acf1 is not None and not force:
+                return
+
+            path_excel = self._get_path(".xlsx")
+
+            # Prefer the binary sidecar cache written on a previous parse.
+            cached = read_array_cache(path_excel, self._CACHE_NAMES)
+            if cached is not None:
+                self._lagtimes = cached["lagtimes"]
+                self._sd1 = cached["sd1"]
+                self._fit1 = cached["fit1"]
+                self._fit1_param = json.loads(cached["fit1_param_json"].item())
+                self._fit1_results = cached["fit1_results"]
+                self._acf1 = cached["acf1"]
+                self._update_loaded_flag()
+                return
 
             df = read_excel_imfcs_saved(path_excel=path_excel)
 
@@ -233,49 +364,135 @@ class ImageInfo:
                 "Overlap",
             ]
             param_dict = get_param(excel_data=df, panel_param=panel_param)
-            self.lagtimes = get_lagtimes(excel_data=df)
+            lagtimes = get_lagtimes(excel_data=df, dtype=np.float32)
+            width = int(param_dict["Image width"])
+            height = int(param_dict["Image height"])
 
-            self.acf1 = get_cfs(
+            # One contiguous buffer for the correlation sheets, exposed as views.
+            acf1, sd1, fit1 = get_cfs_stack(
                 excel_data=df,
-                width=int(param_dict["Image width"]),
-                height=int(param_dict["Image height"]),
-                num_lag=self.lagtimes.shape[0],
-                sheet_name="ACF1",
+                width=width,
+                height=height,
+                num_lag=lagtimes.shape[0],
+                sheet_names=["ACF1", "SD (ACF1)", "Fit functions (ACF1)"],
+                dtype=np.float32,  # Ample precision for correlation curves.
             )
 
-            self.sd1 = get_cfs(
+            fit1_param = get_fit_param(
                 excel_data=df,
-                width=int(param_dict["Image width"]),
-                height=int(param_dict["Image height"]),
-                num_lag=self.lagtimes.shape[0],
-                sheet_name="SD (ACF1)",
-            )
-            self.fit1 = get_cfs(
-                excel_data=df,
-                width=int(param_dict["Image width"]),
-                height=int(param_dict["Image height"]),
-                num_lag=self.lagtimes.shape[0],
-                sheet_name="Fit functions (ACF1)",
-            )
-
-            self.fit1_param = get_fit_param(
-                excel_data=df,
-                width=int(param_dict["Image width"]),
-                height=int(param_dict["Image height"]),
+                width=width,
+                height=height,
                 sheet_name="Fit Parameters (ACF1)",
             )
 
-            self.fit1_results = get_fit_results(
+            fit1_results = get_fit_results(
                 excel_data=df,
-                width=int(param_dict["Image width"]),
-                height=int(param_dict["Image height"]),
+                width=width,
+                height=height,
                 sheet_name="Fit Parameters (ACF1)",
+                dtype=np.float32,
+            )
+            fit1_results[:, :, 2] *= _SCALE_D  # In place, keeps float32.
+
+            self._lagtimes = lagtimes
+            self._sd1 = sd1
+            self._fit1 = fit1
+            self._fit1_param = fit1_param
+            self._fit1_results = fit1_results
+            self._acf1 = acf1  # Assigned last: marks the Excel data as loaded.
+
+            self._update_loaded_flag()
+
+            try:
+                fit1_param_json = json.dumps(fit1_param)
+            except TypeError:
+                return  # E.g., a date header cell, not cached.
+
+            write_array_cache(
+                path_excel,
+                {
+                    "lagtimes": lagtimes,
+                    "acf1": acf1,
+                    "sd1": sd1,
+                    "fit1": fit1,
+                    "fit1_param_json": np.array(fit1_param_json),
+                    "fit1_results": fit1_results,
+                },
             )
-            self.fit1_results[:, :, 2] *= 10**12
 
-            self.avr_intensity = tifffile.imread(path_avr_intensity)
+    def _load_avr_intensity(self, force: bool = False, prefetch: Future = None):
+        """
+        Read ``avr_intensity`` from the ``*_AVR.tif`` file, or take it from
+        ``prefetch`` if the read was already submitted to ``_TIFF_POOL``.
+        """
+        with self._lock:
+            if self._avr_intensity is not None and not force:
+                return
+
+            if prefetch is not None:
+                self._avr_intensity = prefetch.result()
+            else:
+                self._avr_intensity = read_avr_intensity(self._get_path(".tif"))
+
+            self._update_loaded_flag()
+
+    def get_excel_arrays(self) -> dict:
+        """
+        Return the Excel-derived attributes by name, loading them if needed.
+
+        Used to parse a file in a worker process and hand the result back with
+        ``set_excel_arrays``.
+        """
+        return {attr: self._get_excel_attr(attr) for attr in self._EXCEL_ATTRS}
 
-            self.is_excel_data_and_avr_intensity_loaded = True
+    def set_excel_arrays(self, arrays: dict):
+        """
+        Set the Excel-derived attributes from ``arrays``, as returned by
+        ``get_excel_arrays``, instead of parsing the Excel file.
+        """
+        with self._lock:
+            for attr in self._EXCEL_ATTRS:
+                setattr(self, f"_{attr}", arrays[attr])
+            self._update_loaded_flag()
+
+    def _get_excel_attr(self, attr: str):
+        value = getattr(self, f"_{attr}")
+        if value is None:
+            self._check_input_folder(attr)
+            self._load_excel()
+            value = getattr(self, f"_{attr}")
+        return value
+
+    @property
+    def lagtimes(self):
+        return self._get_excel_attr("lagtimes")
+
+    @property
+    def acf1(self):
+        return self._get_excel_attr("acf1")
+
+    @property
+    def sd1(self):
+        return self._get_excel_attr("sd1")
+
+    @property
+    def fit1(self):
+        return self._get_excel_attr("fit1")
+
+    @property
+    def fit1_param(self):
+        return self._get_excel_attr("fit1_param")
+
+    @property
+    def fit1_results(self):
+        return self._get_excel_attr("fit1_results")
+
+    @property
+    def avr_intensity(self):
+        if self._avr_intensity is None:
+            self._check_input_folder("avr_intensity")
+            self._load_avr_intensity()
+        return self._avr_intensity
 
     def get_variable(self, variable_name: str):
         """
@@ -297,33 +514,13 @@ class ImageInfo:
             If the attribute does not exist, or if it has not yet been loaded
             (for Excel/averaged-intensity–dependent attributes).
         """
-        # Check if the attribute exists.
-        if hasattr(self, variable_name):
+        # Set lookup instead of hasattr, which would also load lazy arrays once
+        # only to have getattr return them a second time.
+        if variable_name in self._VARIABLES:
+            # Lazy arrays raise AttributeError themselves if they cannot be loaded.
             return getattr(self, variable_name)
-        else:
-            if self.is_excel_data_and_avr_intensity_loaded:
-                raise AttributeError(
-                    f"'{type(self).__name__}' object has no attribute '{variable_name}'"
-                )
-            else:
-                raise AttributeError(
-                    f"'{type(self).__name__}' object attribute '{variable_name} has not been loaded'"
-                )
-
-    def __repr__(self):
-        return (
-            f"ImageInfo(key={self.key}, "
-            f"associated_files={self.associated_files}, "
-            f"rect_coordinates={self.rect_coordinates}, "
-            f"is_roi_selected={self.is_roi_selected})"
-        )
-
-    def __repr__(self):
-        return (
-            f"ImageInfo(key={self.key}, "
-            f"associated_files={self.associated_files}, "
-            f"rect_coordinates={self.rect_coordinates}, "
-            f"is_roi_selected={self.is_roi_selected})"
+        raise AttributeError(
+            f"'{type(self).__name__}' object has no attribute '{variable_name}'"
         )
 
     def __repr__(self):
@@ -1,7 +1,18 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
+
 import numpy as np
 
+from ..analysis.fcs_metrics import calculate_nrmsd, calculate_snr
 from .all_image import AllImage
 
+# Fill the all-cell arrays with a thread pool, set to False to fill serially.
+IMFCS_PARALLEL_AGGREGATE = True
+
+# Suffix of the file next to an ``mmap_path`` naming the variable it holds.
+_MMAP_VAR_SUFFIX = ".var"
+
 
 def get_total_num_cell(allimage: AllImage):
     """
@@ -22,7 +33,91 @@ def get_total_num_cell(allimage: AllImage):
     return len(allimage.get_list_of_image())
 
 
-def get_array_intensity(allimage: AllImage, cell_index: int = None):
+def _read_mmap_var(mmap_path: str):
+    # Variable stored in ``mmap_path``, or None if the file was not completed.
+    try:
+        with open(mmap_path + _MMAP_VAR_SUFFIX) as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+def _stack_variable(
+    allimage: AllImage, var: str, out: np.ndarray = None, mmap_path: str = None
+):
+    # Stack the per-cell arrays into ``out``, a ``.npy`` memmap at ``mmap_path``,
+    # or a new array cached on ``allimage``.
+    # Assume all files has the same dimension TODO: add checker.
+    use_cache = out is None and mmap_path is None
+    if use_cache:
+        cached = allimage._get_aggregate(var)
+        if cached is not None:
+            return cached
+
+    list_image = allimage.get_list_of_image()
+    num_cell = len(list_image)
+
+    is_new_mmap = out is None and mmap_path is not None
+    if is_new_mmap and os.path.exists(mmap_path):
+        mmap_var = _read_mmap_var(mmap_path)
+        if mmap_var is not None and mmap_var != var:
+            raise ValueError(f"'{mmap_path}' holds '{mmap_var}', not '{var}'.")
+        if mmap_var == var:
+            # Reattach to the file written by a previous call, paged in on
+            # demand, unless the cells no longer match it.
+            arr_all_cell = np.load(mmap_path, mmap_mode="r")
+            first = getattr(list_image[0], var)
+            if (
+                arr_all_cell.shape == (num_cell,) + first.shape
+                and arr_all_cell.dtype == first.dtype
+            ):
+                return arr_all_cell
+            # Rebuilt below, marked incomplete until it is filled.
+            os.remove(mmap_path + _MMAP_VAR_SUFFIX)
+
+    # Lazy loads and the per-cell copies release the GIL, fill rows concurrently.
+    executor = None
+    if IMFCS_PARALLEL_AGGREGATE and num_cell > 1:
+        executor = ThreadPoolExecutor(max_workers=min(8, num_cell))
+    map_cells = executor.map if executor is not None else map
+
+    try:
+        # Known attribute names, read directly instead of through get_variable.
+        arrays = list(map_cells(attrgetter(var), list_image))
+        if out is None:
+            # Keep the source dtype (e.g., uint16 intensity, float32 correlations).
+            shape = (num_cell,) + arrays[0].shape
+            dtype = np.result_type(*arrays)
+            if mmap_path is not None:
+                out = np.lib.format.open_memmap(
+                    mmap_path, mode="w+", shape=shape, dtype=dtype
+                )
+            else:
+                out = np.empty(shape, dtype=dtype)
+        # Consume the iterator so exceptions from workers are raised here.
+        list(map_cells(np.copyto, out, arrays))
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    if isinstance(out, np.memmap):
+        out.flush()
+    if is_new_mmap:
+        with open(mmap_path + _MMAP_VAR_SUFFIX, "w") as f:
+            f.write(var)
+    if use_cache:
+        # Shared between callers, so guard the cached copy against in-place edits.
+        out.flags.writeable = False
+        allimage._set_aggregate(var, out)
+    return out
+
+
+def get_array_intensity(
+    allimage: AllImage,
+    cell_index: int = None,
+    out: np.ndarray = None,
+    mmap_path: str = None,
+):
     """
     Return the average intensity array for a specific cell or for all cells.
 
@@ -34,6 +129,16 @@ def get_array_intensity(allimage: AllImage, cell_index: int = None):
         Index of the cell whose intensity array should be returned.
         If ``None`` (default), the function returns a stacked array
         containing intensities for all cells.
+    out : numpy.ndarray, optional
+        Preallocated array of shape ``(num_cells, n, w, h)`` to fill when
+        ``cell_index`` is ``None``, avoiding a new allocation on repeated calls.
+    mmap_path : str, optional
+        Path of a ``.npy`` file backing the all-cell array as a memory map,
+        for datasets larger than RAM. The file is written on the first call,
+        with the variable name in ``<mmap_path>.var``, and reattached read-only
+        on later calls while the number of cells, shape and dtype still match;
+        otherwise it is rebuilt. A file holding another variable raises
+        ``ValueError``.
 
     Returns
     -------
@@ -50,26 +155,26 @@ def get_array_intensity(allimage: AllImage, cell_index: int = None):
     -----
     This function assumes all images have the same spatial dimensions.
     A consistency check may be added in the future.
+    The stacked array keeps the dtype of the source images.
+    The all-cell array is cached on ``allimage`` and returned read-only, use
+    ``.copy()`` before modifying it in place.
     """
 
     if cell_index is not None:
         arr_int_single_cell = allimage.get_image_info_from_list(
             cell_index
-        ).get_variable(variable_name="avr_intensity")
+        ).avr_intensity
         return arr_int_single_cell
     else:
-        # Sample the first frame, assume all files has the same dimension TODO: add checker.
-        num_cell = get_total_num_cell(allimage)
-        n, w, h = get_array_intensity(allimage, 0).shape
-        array_int_all_cell = np.empty((num_cell, n, w, h))
-        for i in range(num_cell):
-            array_int_all_cell[i, :, :, :] = allimage.get_image_info_from_list(
-                i
-            ).get_variable(variable_name="avr_intensity")
-        return array_int_all_cell
+        return _stack_variable(allimage, "avr_intensity", out=out, mmap_path=mmap_path)
 
 
-def get_array_parameter_map(allimage: AllImage, cell_index: int = None):
+def get_array_parameter_map(
+    allimage: AllImage,
+    cell_index: int = None,
+    out: np.ndarray = None,
+    mmap_path: str = None,
+):
     """
     Return the parameter map array for a specific cell or for all cells.
 
@@ -81,6 +186,16 @@ def get_array_parameter_map(allimage: AllImage, cell_index: int = None):
         Index of the cell whose parameter map should be retrieved.
         If ``None`` (default), the function returns a stacked array
         containing the parameter maps for all cells.
+    out : numpy.ndarray, optional
+        Preallocated array of shape ``(num_cells, w, h, p)`` to fill when
+        ``cell_index`` is ``None``, avoiding a new allocation on repeated calls.
+    mmap_path : str, optional
+        Path of a ``.npy`` file backing the all-cell array as a memory map,
+        for datasets larger than RAM. The file is written on the first call,
+        with the variable name in ``<mmap_path>.var``, and reattached read-only
+        on later calls while the number of cells, shape and dtype still match;
+        otherwise it is rebuilt. A file holding another variable raises
+        ``ValueError``.
 
     Returns
     -------
@@ -97,23 +212,17 @@ def get_array_parameter_map(allimage: AllImage, cell_index: int = None):
     -----
     This function assumes that all parameter maps share identical
     dimensions. A dimension consistency check may be added later.
+    The all-cell array is cached on ``allimage`` and returned read-only, use
+    ``.copy()`` before modifying it in place.
     """
 
     if cell_index is not None:
         arr_pmap_single_cell = allimage.get_image_info_from_list(
             cell_index
-        ).get_variable(variable_name="fit1_results")
+        ).fit1_results
         return arr_pmap_single_cell
     else:
-        # Assume all files has the same dimension TODO: add checker.
-        num_cell = get_total_num_cell(allimage)
-        w, h, p = get_array_parameter_map(allimage, 0).shape
-        arr_pmap_all_cell = np.empty((num_cell, w, h, p))
-        for i in range(num_cell):
-            arr_pmap_all_cell[i, :, :, :] = allimage.get_image_info_from_list(
-                i
-            ).get_variable(variable_name="fit1_results")
-        return arr_pmap_all_cell
+        return _stack_variable(allimage, "fit1_results", out=out, mmap_path=mmap_path)
 
 
 def get_list_of_file_id(allimage: AllImage):
@@ -132,12 +241,17 @@ def get_list_of_file_id(allimage: AllImage):
         of TIFF stacks or other image group identifiers.
     """
 
-    num_cell = get_total_num_cell(allimage)
     l_id = [img.key for img in allimage.get_list_of_image()]
     return l_id
 
 
-def get_cfs_related(allimage: AllImage, var: str = "acf1", cell_index: int = None):
+def get_cfs_related(
+    allimage: AllImage,
+    var: str = "acf1",
+    cell_index: int = None,
+    out: np.ndarray = None,
+    mmap_path: str = None,
+):
     # option for var = acf1, sd1, fit1
 
     """
@@ -155,6 +269,16 @@ def get_cfs_related(allimage: AllImage, var: str = "acf1", cell_index: int = Non
     cell_index : int, optional
         Index of the cell whose correlation-function array should be returned.
         If ``None`` (default), the function returns a stacked array for all cells.
+    out : numpy.ndarray, optional
+        Preallocated array of shape ``(num_cells, w, h, lag)`` to fill when
+        ``cell_index`` is ``None``, avoiding a new allocation on repeated calls.
+    mmap_path : str, optional
+        Path of a ``.npy`` file backing the all-cell array as a memory map,
+        for datasets larger than RAM. The file is written on the first call,
+        with the variable name in ``<mmap_path>.var``, and reattached read-only
+        on later calls while the number of cells, shape and dtype still match;
+        otherwise it is rebuilt. A file holding another variable raises
+        ``ValueError``.
 
     Returns
     -------
@@ -171,27 +295,24 @@ def get_cfs_related(allimage: AllImage, var: str = "acf1", cell_index: int = Non
     -----
     - Assumes all files share identical spatial and lag dimensions.
     - Assumes all pixels are processed using the same correlator configuration.
+    - The all-cell array is cached on ``allimage`` and returned read-only, use
+      ``.copy()`` before modifying it in place.
     """
 
     if cell_index is not None:
-        arr_single_cell = allimage.get_image_info_from_list(cell_index).get_variable(
-            variable_name=var
-        )
+        arr_single_cell = getattr(allimage.get_image_info_from_list(cell_index), var)
         return arr_single_cell
     else:
-        # Assume all files has the same dimension TODO: add checker.
         # Assume all pixel in each file are processed the same way with identical correlator scheme.
-        num_cell = get_total_num_cell(allimage)
-        w, h, lag = get_cfs_related(allimage, var, 0).shape
-        arr_all_cell = np.empty((num_cell, w, h, lag))
-        for i in range(num_cell):
-            arr_all_cell[i, :, :, :] = allimage.get_image_info_from_list(
-                i
-            ).get_variable(variable_name=var)
-        return arr_all_cell
+        return _stack_variable(allimage, var, out=out, mmap_path=mmap_path)
 
 
-def get_lagtimes(allimage: AllImage, cell_index: int = None):
+def get_lagtimes(
+    allimage: AllImage,
+    cell_index: int = None,
+    out: np.ndarray = None,
+    mmap_path: str = None,
+):
     """
     Return the lag-time array for a specific cell or for all cells.
 
@@ -202,6 +323,16 @@ def get_lagtimes(allimage: AllImage, cell_index: int = None):
     cell_index : int, optional
         Index of the cell to retrieve lag times from.
         If ``None`` (default), lag times for all cells are returned.
+    out : numpy.ndarray, optional
+        Preallocated array of shape ``(num_cells, lag)`` to fill when
+        ``cell_index`` is ``None``, avoiding a new allocation on repeated calls.
+    mmap_path : str, optional
+        Path of a ``.npy`` file backing the all-cell array as a memory map,
+        for datasets larger than RAM. The file is written on the first call,
+        with the variable name in ``<mmap_path>.var``, and reattached read-only
+        on later calls while the number of cells, shape and dtype still match;
+        otherwise it is rebuilt. A file holding another variable raises
+        ``ValueError``.
 
     Returns
     -------
@@ -217,22 +348,82 @@ def get_lagtimes(allimage: AllImage, cell_index: int = None):
     -----
     Assumes all cells have the same lag-time dimensionality and were processed
     with the same correlator scheme.
+    The all-cell array is cached on ``allimage`` and returned read-only, use
+    ``.copy()`` before modifying it in place.
     """
 
     var = "lagtimes"
 
     if cell_index is not None:
-        lagtimes_single_cell = allimage.get_image_info_from_list(
-            cell_index
-        ).get_variable(variable_name=var)
+        lagtimes_single_cell = allimage.get_image_info_from_list(cell_index).lagtimes
         return lagtimes_single_cell
     else:
         # Assume all pixel in each file are processed the same way with identical correlator scheme.
-        num_cell = get_total_num_cell(allimage)
-        lag = get_lagtimes(allimage, 0).shape[0]
-        lagtimes_all_cell = np.empty((num_cell, lag))
-        for i in range(num_cell):
-            lagtimes_all_cell[i, :] = allimage.get_image_info_from_list(i).get_variable(
-                variable_name=var
-            )
-        return lagtimes_all_cell
+        return _stack_variable(allimage, var, out=out, mmap_path=mmap_path)
+
+
+def get_array_nrmsd(allimage: AllImage, cell_index: int = None):
+    """
+    Return the NRMSD map between ``acf1`` and ``fit1`` for a specific cell or
+    for all cells.
+
+    Parameters
+    ----------
+    allimage : AllImage
+        The ``AllImage`` instance containing multiple ``ImageInfo`` objects.
+    cell_index : int, optional
+        Index of the cell to compute the NRMSD for.
+        If ``None`` (default), the NRMSD of all cells is computed in one batched
+        call on the stacked arrays.
+
+    Returns
+    -------
+    numpy.ndarray
+        If ``cell_index`` is provided:
+            Returns an array of shape ``(w, h)``.
+
+        If ``cell_index`` is ``None``:
+            Returns an array of shape ``(num_cells, w, h)``.
+
+    Notes
+    -----
+    The normalization factor is the fitted particle number ``N`` (index 1 of
+    ``fit1_results``).
+    """
+
+    return calculate_nrmsd(
+        observed=get_cfs_related(allimage, var="acf1", cell_index=cell_index),
+        predicted=get_cfs_related(allimage, var="fit1", cell_index=cell_index),
+        N_fit=get_array_parameter_map(allimage, cell_index=cell_index)[..., 1],
+    )
+
+
+def get_array_snr(allimage: AllImage, cell_index: int = None, last_lag: int = 6):
+    """
+    Return the SNR map of ``acf1`` for a specific cell or for all cells.
+
+    Parameters
+    ----------
+    allimage : AllImage
+        The ``AllImage`` instance containing multiple ``ImageInfo`` objects.
+    cell_index : int, optional
+        Index of the cell to compute the SNR for.
+        If ``None`` (default), the SNR of all cells is computed in one batched
+        call on the stacked arrays.
+    last_lag : int, optional
+        Last lag time index used for the SNR, see ``calculate_snr``.
+
+    Returns
+    -------
+    numpy.ndarray
+        If ``cell_index`` is provided:
+            Returns an array of shape ``(w, h)``.
+
+        If ``cell_index`` is ``None``:
+            Returns an array of shape ``(num_cells, w, h)``.
+    """
+
+    return calculate_snr(
+        cf=get_cfs_related(allimage, var="acf1", cell_index=cell_index),
+        last_lag=last_lag,
+    )
@@ -1,5 +1,8 @@
+from .array_cache import read_array_cache, write_array_cache
+from .reader_avr_intensity import read_avr_intensity
 from .reader_imfcs_excel_output import (
     get_cfs,
+    get_cfs_stack,
     get_fit_param,
     get_fit_results,
     get_lagtimes,
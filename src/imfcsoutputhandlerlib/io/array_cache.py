@@ -0,0 +1,78 @@
+import os
+import tempfile
+import zipfile
+
+import numpy as np
+
+CACHE_SUFFIX = ".cache.npz"
+
+# Name of the cached (mtime_ns, size) of the source file the arrays came from.
+_SOURCE_STAT = "_source_stat"
+
+
+def get_cache_path(path_source: str) -> str:
+    return path_source + CACHE_SUFFIX
+
+
+def _get_source_stat(path_source: str) -> np.ndarray:
+    st = os.stat(path_source)
+    return np.array([st.st_mtime_ns, st.st_size], dtype=np.int64)
+
+
+def read_array_cache(path_source: str, names: tuple[str, ...]):
+    """
+    Read arrays previously cached next to ``path_source``.
+
+    Parameters
+    ----------
+    path_source : str
+        Path to the source file (e.g., the ImFCS ``.xlsx`` output).
+    names : tuple of str
+        Names of the arrays expected in the cache.
+
+    Returns
+    -------
+    dict or None
+        Mapping of array name to ``numpy.ndarray``, or ``None`` if the cache is
+        missing, was written for a different version of the source file (by
+        modification time and size), incomplete or unreadable.
+    """
+    path_cache = get_cache_path(path_source)
+
+    try:
+        with np.load(path_cache, allow_pickle=False) as npz:
+            if not all(name in npz.files for name in (_SOURCE_STAT, *names)):
+                return None
+            if not np.array_equal(npz[_SOURCE_STAT], _get_source_stat(path_source)):
+                return None  # Stale, source replaced or modified after caching.
+            return {name: npz[name] for name in names}
+    except (OSError, ValueError, EOFError, KeyError, zipfile.BadZipFile):
+        return None  # Truncated or corrupt cache, parse the source again.
+
+
+def write_array_cache(path_source: str, arrays: dict):
+    """
+    Cache ``arrays`` in an uncompressed ``.npz`` file next to ``path_source``.
+
+    Failing to write (e.g., read-only data folder) is not an error, the source
+    file is simply parsed again on the next load.
+    """
+    path_cache = get_cache_path(path_source)
+    path_tmp = None
+
+    try:
+        source_stat = _get_source_stat(path_source)
+        # Unique temporary file in the same folder, loader workers and a lazy GUI
+        # load may write the same cache concurrently.
+        fd, path_tmp = tempfile.mkstemp(
+            suffix=".tmp",
+            prefix=os.path.basename(path_cache) + ".",
+            dir=os.path.dirname(path_cache) or None,
+        )
+        os.chmod(path_tmp, 0o644)  # mkstemp creates it owner-only.
+        with os.fdopen(fd, "wb") as f:
+            np.savez(f, **arrays, **{_SOURCE_STAT: source_stat})
+        os.replace(path_tmp, path_cache)  # Never expose a partially written cache.
+    except OSError:
+        if path_tmp is not None and os.path.exists(path_tmp):
+            os.remove(path_tmp)
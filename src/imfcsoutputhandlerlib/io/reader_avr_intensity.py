@@ -0,0 +1,15 @@
+import numpy as np
+
+
+def read_avr_intensity(path_avr_intensity: str) -> np.ndarray:
+    # Deferred until the first TIFF is read, importing the package (e.g., to
+    # reopen a pickled AllImage from its array caches) does not load tifffile.
+    import tifffile
+
+    # Read-only memory map: pages are read on demand and shared through the OS
+    # page cache. Callers that modify the stack must copy it first.
+    try:
+        return tifffile.memmap(path_avr_intensity, mode="r")
+    except ValueError:
+        # Compressed or non-contiguous TIFFs cannot be memory-mapped.
+        return tifffile.imread(path_avr_intensity)
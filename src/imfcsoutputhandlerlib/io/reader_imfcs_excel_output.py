@@ -1,11 +1,26 @@
 import math
 import warnings
+import weakref
 
 import numpy as np
 import pandas as pd
 
 warnings.filterwarnings("ignore", category=UserWarning, module="openpyxl")
 
+try:
+    import python_calamine  # noqa: F401
+
+    # Rust-backed reader, parses .xlsx several times faster than openpyxl.
+    EXCEL_ENGINE = "calamine"
+except ImportError:  # python-calamine is optional, fall back to openpyxl.
+    EXCEL_ENGINE = "openpyxl"
+
+# Values of the "fitted" column of the fit parameter sheets.
+_FITTED_FLAGS = {"true": 1.0, "false": 0.0, True: 1.0, False: 0.0}
+
+# Sheets already parsed, per workbook. Dropped together with the workbook.
+_parsed_sheets = weakref.WeakKeyDictionary()
+
 
 def check_matching_metadata():
     # Iterate through metadata file for all basename and check for matching parameters.
@@ -13,7 +28,16 @@ def check_matching_metadata():
 
 
 def read_excel_imfcs_saved(path_excel: str):
-    return pd.ExcelFile(path_excel)
+    return pd.ExcelFile(path_excel, engine=EXCEL_ENGINE)
+
+
+def _parse_sheet(excel_data: pd.ExcelFile, sheet_name: str) -> pd.DataFrame:
+    # Parse each sheet once, e.g. "Fit Parameters (ACF1)" is read by both
+    # get_fit_param and get_fit_results.
+    sheets = _parsed_sheets.setdefault(excel_data, {})
+    if sheet_name not in sheets:
+        sheets[sheet_name] = excel_data.parse(sheet_name=sheet_name, header=None)
+    return sheets[sheet_name]
 
 
 def get_param(excel_data: pd.DataFrame, panel_param: list[str]):
@@ -22,49 +46,82 @@ def get_param(excel_data: pd.DataFrame, panel_param: list[str]):
     ), "Panel Parameters is not in the sheet"
 
     # Extract Image width and Image height based on their parameter names.
-    panel_parameters_sheet = excel_data.parse(
-        sheet_name="Panel Parameters", header=None
-    )
+    panel_parameters_sheet = _parse_sheet(excel_data, "Panel Parameters")
 
     first_column = panel_parameters_sheet.iloc[:, 0]  # First column by index.
-    values = []
-    for j in panel_param:
-        index = first_column[first_column == j].index
 
-        assert not index.empty, " index empty"
-        # print(f"The value '{j}' is found at index: {index[0]}, val: {panel_parameters_sheet.iloc[index[0], 1]}")
-        values.append(panel_parameters_sheet.iloc[index[0], 1])
+    # Look up all parameter rows in one pass, first occurrence of each name.
+    first_column = first_column[~first_column.duplicated()]
+    index = pd.Index(first_column).get_indexer(panel_param)
+
+    assert (index >= 0).all(), " index empty"
+    values = panel_parameters_sheet.iloc[first_column.index[index], 1].tolist()
 
     param_dict = {key: value for key, value in zip(panel_param, values)}
     return param_dict
 
 
-def get_lagtimes(excel_data: pd.DataFrame):
+def get_lagtimes(excel_data: pd.DataFrame, dtype=float):
     sn = "lagtime"
     assert sn in excel_data.sheet_names, f"{sn} is not in the sheet"
 
     # Load lagtimes.
-    lagtime_sheet = excel_data.parse(sheet_name=sn, header=None)
-    lagtimes = lagtime_sheet.iloc[1:, 1].to_numpy()
+    lagtime_sheet = _parse_sheet(excel_data, sn)
+    lagtimes = lagtime_sheet.iloc[1:, 1].to_numpy(dtype=dtype)
 
     return lagtimes
 
 
 def get_cfs(
-    excel_data: pd.DataFrame, width: int, height: int, num_lag: int, sheet_name: str
+    excel_data: pd.DataFrame,
+    width: int,
+    height: int,
+    num_lag: int,
+    sheet_name: str,
+    out: np.ndarray = None,
 ):
-    # TODO: slow. can be improved 1) convert panda to numpy 2) Use numpy Directly for Numeric Sheets.
     # Sheet names: "ACF1", "SD (ACF1)", "Fit functions (ACF1)".
+    # If given, ``out`` (height, width, num_lag) is filled instead of a new array.
     assert sheet_name in excel_data.sheet_names, f"{sheet_name} is not in the sheet"
 
-    sheet = excel_data.parse(sheet_name=sheet_name, header=None)
+    sheet = _parse_sheet(excel_data, sheet_name)
+
+    # One row per pixel in row-major order (row = j + i * width), first column
+    # is the pixel label. Convert the numeric block once and reshape, instead
+    # of indexing the DataFrame pixel by pixel.
+    block = sheet.iloc[: height * width, 1 : 1 + num_lag].to_numpy(dtype=float)
+    block = block.reshape(height, width, num_lag)
+
+    if out is None:
+        res = block
+    else:
+        res = out
+        np.copyto(res, block)
+
+    return res
 
-    res = np.empty((height, width, num_lag), dtype=float)
 
-    for i in range(height):
-        for j in range(width):
-            row_idx = j + (i * height)
-            res[i][j] = sheet.iloc[row_idx, 1:]
+def get_cfs_stack(
+    excel_data: pd.DataFrame,
+    width: int,
+    height: int,
+    num_lag: int,
+    sheet_names: list[str],
+    dtype=float,
+):
+    # Fill the correlation sheets into one contiguous buffer of shape
+    # (num_sheet, height, width, num_lag); callers keep views res[k] per sheet.
+    res = np.empty((len(sheet_names), height, width, num_lag), dtype=dtype)
+
+    for k, sheet_name in enumerate(sheet_names):
+        get_cfs(
+            excel_data=excel_data,
+            width=width,
+            height=height,
+            num_lag=num_lag,
+            sheet_name=sheet_name,
+            out=res[k],
+        )
 
     return res
 
@@ -73,39 +130,50 @@ def get_fit_param(excel_data: pd.DataFrame, width: int, height: int, sheet_name:
     # Sheet names: "Fit Parameters (ACF1)", "Fit Parameters (ACF2)", "Fit Parameters (CCF)".
     assert sheet_name in excel_data.sheet_names, f"{sheet_name} is not in the sheet"
 
-    sheet = excel_data.parse(sheet_name=sheet_name, header=None)
+    sheet = _parse_sheet(excel_data, sheet_name)
 
-    return sheet.iloc[0, 1:].to_list()
+    # Header cells as Python scalars, numeric cells of a mixed row would
+    # otherwise stay NumPy scalars.
+    return [
+        value.item() if isinstance(value, np.generic) else value
+        for value in sheet.iloc[0, 1:]
+    ]
 
 
-def get_fit_results(excel_data: pd.DataFrame, width: int, height: int, sheet_name: str):
-    # TODO: slow. can be improved 1) convert panda to numpy 2) Use numpy Directly for Numeric Sheets.
+def get_fit_results(
+    excel_data: pd.DataFrame, width: int, height: int, sheet_name: str, dtype=float
+):
     # Sheet names: "Fit Parameters (ACF1)", "Fit Parameters (ACF2)", "Fit Parameters (CCF)".
     assert sheet_name in excel_data.sheet_names, f"{sheet_name} is not in the sheet"
 
-    sheet = excel_data.parse(sheet_name=sheet_name, header=None)
+    sheet = _parse_sheet(excel_data, sheet_name)
 
     fit_param = get_fit_param(
         excel_data=excel_data, width=width, height=height, sheet_name=sheet_name
     )
     num_param = len(fit_param)
 
-    res = np.zeros((height, width, num_param), dtype=float)
+    res = np.empty((height, width, num_param), dtype=dtype)
+
+    # One row per pixel in row-major order after the header row.
+    body = sheet.iloc[1 : 1 + height * width]
 
     # Fill N, D, .. valid pixels onwards.
-    for i in range(height):
-        for j in range(width):
-            row_idx = j + (i * height) + 1
-            res[i, j, 1:] = sheet.iloc[row_idx, 2:]
-
-    # Fill fitted.
-    for i in range(height):
-        for j in range(width):
-            row_idx = j + (i * height) + 1
-            val = str(sheet.iloc[row_idx, 1])
-            if val in ["true", "false"]:
-                val = 1.0 if val == "true" else 0.0
-            res[i, j, 0] = val
+    res[..., 1:] = (
+        body.iloc[:, 2 : 1 + num_param]
+        .to_numpy(dtype=float)
+        .reshape(height, width, num_param - 1)
+    )
+
+    # Fill fitted, "true"/"false" flags (or booleans) as 1.0/0.0, anything else
+    # as a number.
+    fitted = body.iloc[:, 1]
+    res[..., 0] = (
+        fitted.map(_FITTED_FLAGS)
+        .fillna(pd.to_numeric(fitted, errors="coerce"))
+        .to_numpy(dtype=float)
+        .reshape(height, width)
+    )
 
     return res
 
@@ -115,36 +183,33 @@ def get_psf(excel_data: pd.DataFrame):
     sheet_name = "PSF"
     assert sheet_name in excel_data.sheet_names, f"{sheet_name} is not in the sheet"
 
-    sheet = excel_data.parse(sheet_name=sheet_name, header=None)
+    sheet = _parse_sheet(excel_data, sheet_name)
 
     search_value = "PSF start"
     row_index = int(sheet[sheet.iloc[:, 0] == search_value].index[0]) + 1
 
-    # Reading psf calibration parameter.
+    # Reading psf calibration parameter, one row conversion for all three.
+    psf_start, psf_end, psf_step = sheet.iloc[row_index, :3].to_numpy(dtype=float)
+    bin_start = int(sheet.iloc[1, 0])
     parameters = {
-        "psf start": float(sheet.iloc[row_index, 0]),
-        "psf end": float(sheet.iloc[row_index, 1]),
-        "psf step": float(sheet.iloc[row_index, 2]),
-        "num psf": math.ceil(
-            (
-                (float(sheet.iloc[row_index, 1]) - float(sheet.iloc[row_index, 0]))
-                / float(sheet.iloc[row_index, 2])
-                + 1
-            )
-        ),
+        "psf start": float(psf_start),
+        "psf end": float(psf_end),
+        "psf step": float(psf_step),
+        "num psf": math.ceil((psf_end - psf_start) / psf_step + 1),
         "num bin": row_index - 3,
-        "bin start": int(sheet.iloc[1, 0]),
-        "bin end": int(sheet.iloc[1, 0]) + row_index - 3 - 1,
+        "bin start": bin_start,
+        "bin end": bin_start + row_index - 3 - 1,
     }
 
     # Fill array with D and std D for each combination of pixel bin and PSF value.
-    arr = np.zeros((parameters["num psf"], parameters["num bin"], 2), dtype=float)
-
-    for i in range(parameters["num psf"]):
-        for j in range(parameters["num bin"]):
-            c = i * 3
-            r = j + 1
-            arr[i, j, :] = sheet.iloc[r, c + 1 : c + 3]
+    # Each PSF value i takes three columns, D and std D in columns 3i+1, 3i+2,
+    # one row per pixel bin after the header row.
+    num_psf = parameters["num psf"]
+    block = sheet.iloc[1 : 1 + parameters["num bin"], 1 : 3 * num_psf].to_numpy(
+        dtype=float
+    )
+    arr = np.stack((block[:, 0::3], block[:, 1::3]), axis=-1).transpose(1, 0, 2)
+    arr = np.ascontiguousarray(arr)  # (num psf, num bin, 2).
 
     return parameters, arr
 
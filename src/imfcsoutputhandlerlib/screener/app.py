@@ -1,4 +1,5 @@
-import time
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 
 import matplotlib.pyplot as plt
 from IPython.display import display
@@ -8,7 +9,7 @@ from ..visualization.display_analysis import DisplayAnalysis
 from ..visualization.roi_selector import ROISelector
 from .gui import ImfcsScreenerGUI
 from .gui_components import ErrorOutputManager
-from .loader import OutputDataLoaderMultiThread, OutputDataLoaderSingleThread
+from .loader import OutputDataLoaderMultiThread
 from .logic import ImfcsScreenerLogic
 from .process import ImfcsScreenerProcess
 
@@ -25,27 +26,40 @@ class ImfcsScreenerApp:
     logic: ImfcsScreenerLogic
     process: ImfcsScreenerProcess
     list_all_image: AllImage
-    # raw_data_loader: OutputDataLoaderMultiThread
-    raw_data_loader: OutputDataLoaderSingleThread
+    raw_data_loader: OutputDataLoaderMultiThread
     roi_selector: ROISelector
     display_analysis: DisplayAnalysis
     error_manager: ErrorOutputManager
+    prefetch_pool: ThreadPoolExecutor  # Reads neighbouring images in the background.
+    prefetching: set  # Keys with a prefetch in flight.
+    nav_token: int  # Incremented on every image change, see schedule_image_update.
 
-    def __init__(self, input_path: str, loaded_database: AllImage = None):
+    # Delay before rendering a newly selected image; later clicks within it win.
+    NAV_DEBOUNCE_S = 0.05
+
+    def __init__(
+        self, input_path: str, loaded_database: AllImage = None, num_workers: int = 4
+    ):
         self.error_manager = ErrorOutputManager()
+        self.prefetch_pool = ThreadPoolExecutor(max_workers=2)
+        self.prefetching = set()
+        self.nav_token = 0
         self.gui = ImfcsScreenerGUI(error_manager=self.error_manager)
 
         # Setup from scratch or previously saved database.
         if loaded_database is None:
             self.logic = ImfcsScreenerLogic(input_path=input_path)
             self.list_all_image = AllImage(
-                experiment_name="exp1", group_files=self.logic.get_group_files()
+                experiment_name="exp1",
+                group_files=self.logic.get_group_files(),
+                input_folder=input_path,
             )
         else:
             self.logic = ImfcsScreenerLogic(
                 input_path=input_path, loaded_group_files=loaded_database.grouped_files
             )
             self.list_all_image = loaded_database
+            self.list_all_image.set_input_folder(input_path)
             print(
                 f"Total files loaded from database: {len(self.list_all_image.list_image_info_object)}"
             )
@@ -60,22 +74,13 @@ class ImfcsScreenerApp:
             display_analysis=self.display_analysis,
         )
 
-        """
         self.raw_data_loader = OutputDataLoaderMultiThread(
             list_all_image_object=self.list_all_image,
             progress=self.gui.load_raw_progress,
             progress_label=self.gui.load_raw_progress_label,
             output=self.gui.load_raw_output,
             input_folder=self.logic.get_input_path(),
-        )
-        """
-
-        self.raw_data_loader = OutputDataLoaderSingleThread(
-            list_all_image_object=self.list_all_image,
-            progress=self.gui.load_raw_progress,
-            progress_label=self.gui.load_raw_progress_label,
-            output=self.gui.load_raw_output,
-            input_folder=self.logic.get_input_path(),
+            max_workers=num_workers,
         )
 
         # Initialize dropdown options and value.
@@ -107,8 +112,7 @@ class ImfcsScreenerApp:
             self.on_display_analysis_toggle_change, names="value"
         )
 
-        for _ in range(5):
-            print()  # Prints an empty line.
+        print("\n" * 4)  # Five empty lines in a single write.
 
     def on_debug_button_clicked(self, b):
         # Example Usage: Trigger an error.
@@ -117,26 +121,26 @@ class ImfcsScreenerApp:
         except ValueError as e:
             self.error_manager.display_error(str(e))
 
-        # Example: Clear and hide the error output after handling.
-        time.sleep(3)
-        self.error_manager.clear_error()
+        # Example: Clear and hide the error output after handling, without
+        # blocking the kernel while the error is shown.
+        try:
+            asyncio.get_running_loop().call_later(3, self.error_manager.clear_error)
+        except RuntimeError:  # No event loop (outside a kernel).
+            self.error_manager.clear_error()
 
     def on_clear_button_clicked(self, b):
         """Handle Clear button click."""
         self.gui.output.clear_output()
-        self.gui.roi_selection_output.clear_output()
+        self.roi_selector.clear_plot_roi_selection()
+        self.process.clear_cache()
 
     def on_next_button_clicked(self, b, label):
         """Handle Next button click."""
 
         current_key = self.gui.dropdown.value
         next_key = self.logic.get_next_key(current_key)
-        self.gui.dropdown.value = next_key
+        self.gui.dropdown.value = next_key  # Schedules the image update.
         self.update_selected_filename_label(self.gui.dropdown.value)
-        self.process.display_selected_image(key=self.gui.dropdown.value)
-
-        self.gui.roi_selection_output.clear_output()
-        self.process.set_roi_selection_output(key=self.gui.dropdown.value)
 
         with self.gui.output:
             print(f"click: {label}")
@@ -145,16 +149,60 @@ class ImfcsScreenerApp:
         """Handle Previous button click."""
         current_key = self.gui.dropdown.value
         previous_key = self.logic.get_previous_key(current_key)
-        self.gui.dropdown.value = previous_key
+        self.gui.dropdown.value = previous_key  # Schedules the image update.
         self.update_selected_filename_label(self.gui.dropdown.value)
-        self.process.display_selected_image(key=self.gui.dropdown.value)
-
-        self.gui.roi_selection_output.clear_output()
-        self.process.set_roi_selection_output(key=self.gui.dropdown.value)
 
         with self.gui.output:
             print(f"click: {label}")
 
+    def schedule_image_update(self, key):
+        """
+        Render ``key`` after ``NAV_DEBOUNCE_S`` on the notebook's event loop,
+        unless another image is selected first, so rapid Next/Previous clicks
+        only render the last one.
+        """
+        self.nav_token += 1
+        token = self.nav_token
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:  # No event loop (outside a kernel), render now.
+            self.update_selected_image(key, token)
+            return
+        loop.call_later(self.NAV_DEBOUNCE_S, self.run_image_update, key, token)
+
+    def run_image_update(self, key, token):
+        # Called by the event loop, which would only log an exception to the
+        # kernel console, so report it in the app instead.
+        try:
+            self.update_selected_image(key, token)
+        except Exception as e:
+            self.error_manager.display_error(f"Cannot display '{key}': {e!r}")
+
+    def update_selected_image(self, key, token):
+        if token != self.nav_token:
+            return  # Superseded by a later selection.
+
+        self.process.display_selected_image(key=key)
+
+        # Redraws the ROI selector in place, or removes it when toggled off.
+        self.process.set_roi_selection_output(key=key)
+
+        self.prefetch_neighbor_images(key=key)
+
+    def prefetch_neighbor_images(self, key):
+        """Read the images next to ``key`` in the background for the next click."""
+        for neighbor in (
+            self.logic.get_next_key(key),
+            self.logic.get_previous_key(key),
+        ):
+            if neighbor == key or neighbor in self.prefetching:
+                continue
+            self.prefetching.add(neighbor)
+            future = self.prefetch_pool.submit(
+                self.process.prefetch_selected_image, neighbor
+            )
+            future.add_done_callback(lambda f, k=neighbor: self.prefetching.discard(k))
+
     def update_text_area(self, change):
         """Update the text area based on the selected dropdown value."""
         selected_key = self.gui.dropdown.value
@@ -182,7 +230,7 @@ class ImfcsScreenerApp:
 
     def callback_dropdown_showimage(self, change):
         if change is not None:
-            self.process.display_selected_image(key=change["new"])
+            self.schedule_image_update(key=change["new"])
 
     def on_roi_selection_toggle_change(self, change):
         if change["new"]:
@@ -1,10 +1,10 @@
-import ipywidgets as widgets
-
-
 class ErrorOutputManager:
     """
     Displaying error messages in a Jupyter
     ``ipywidgets.Output`` area.
+
+    The ``ipywidgets`` import and the output widget are deferred until the
+    widget is first needed.
     """
 
     _instance = None
@@ -12,7 +12,14 @@ class ErrorOutputManager:
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
-            cls._instance.error_output = widgets.Output(
+            cls._instance.error_output = None
+        return cls._instance
+
+    def _ensure_widget(self):
+        if self.error_output is None:
+            import ipywidgets as widgets
+
+            self.error_output = widgets.Output(
                 layout=widgets.Layout(
                     width="800px",
                     height="100px",
@@ -22,18 +29,21 @@ class ErrorOutputManager:
                     display="none",
                 )
             )
-        return cls._instance
+        return self.error_output
 
     def display_error(self, message):
+        self._ensure_widget()
         self.error_output.layout.display = "block"
         with self.error_output:
             self.error_output.clear_output(wait=True)
             print(f"Error: {message}")
 
     def clear_error(self):
+        if self.error_output is None:
+            return  # Nothing displayed yet.
         with self.error_output:
             self.error_output.clear_output(wait=True)
         self.error_output.layout.display = "none"
 
     def get_error_output(self):
-        return self.error_output
+        return self._ensure_widget()
@@ -1,4 +1,5 @@
 import concurrent.futures
+import multiprocessing
 import os
 import threading
 import time
@@ -10,6 +11,14 @@ from ..core.all_image import AllImage
 from ..core.image_info import ImageInfo
 
 
+def _parse_excel_arrays(key: str, associated_files: list[str], input_folder: str):
+    # Runs in a worker process: only the file names go in, only the arrays come out.
+    im_info = ImageInfo(
+        key=key, associated_files=associated_files, input_folder=input_folder
+    )
+    return im_info.get_excel_arrays()
+
+
 class OutputDataLoaderSingleThread:
     """
     Single-threaded loader for Excel-based output data.
@@ -69,6 +78,9 @@ class OutputDataLoaderSingleThread:
 
         start_time = time.time()  # Start timer.
 
+        # Widget updates are costly kernel messages, send at most one per percent.
+        next_log_at = 0
+
         while (
             self.current_progress < self.total_iterations
             and not self.stop_flag.is_set()
@@ -78,8 +90,6 @@ class OutputDataLoaderSingleThread:
             percentage = int((self.current_progress + 1) / self.total_iterations * 100)
 
             # Work start.
-            time.sleep(0.1)
-
             im_info = self.list_all_image_object.get_image_info_from_list(
                 index=self.current_progress
             )
@@ -89,6 +99,10 @@ class OutputDataLoaderSingleThread:
             # Work end.
 
             self.current_progress += 1  # Increment progress.
+            if percentage < next_log_at:
+                continue
+            next_log_at = percentage + 1
+
             self.progress.value = percentage
             self.progress_label.value = f"{percentage}%"
 
@@ -99,6 +113,7 @@ class OutputDataLoaderSingleThread:
         if self.stop_flag.is_set():
             print(f"{self.GREEN}Process stopped.{self.RESET}")
         elif self.current_progress >= self.total_iterations:
+            self.list_all_image_object.consolidate()
             end_time = time.time()  # End timer
             elapsed_time = end_time - start_time
             print(
@@ -169,6 +184,7 @@ class OutputDataLoaderMultiThread:
     output: widgets.Output
 
     input_folder: str
+    max_workers: int
 
     GREEN = "\033[32m"
     RESET = "\033[0m"  # Reset to default color.
@@ -180,6 +196,7 @@ class OutputDataLoaderMultiThread:
         progress_label: widgets.Label,
         output: widgets.Output,
         input_folder: str,
+        max_workers: int = None,
     ):
         self.list_all_image_object = list_all_image_object
         # num_entries = 1000
@@ -191,14 +208,18 @@ class OutputDataLoaderMultiThread:
         self.progress_label = progress_label
         self.output = output
         self.input_folder = input_folder
-        self.progress_checklist = [False for _ in range(self.total_iterations)]
+        self.max_workers = max_workers  # Worker processes, os.cpu_count() if None.
+        self.progress_checklist = bytearray(self.total_iterations)  # 1 when loaded.
+        self.num_loaded = 0  # Running count of set entries in progress_checklist.
         self.thread = None
         self.stop_flag = threading.Event()  # Use threading.Event for stop_flag.
         self.stop_flag.clear()
 
-    def process_data(self, im_info: ImageInfo):
+    def process_data(self, im_info: ImageInfo, excel_arrays: dict):
         # time.sleep(0.1)
-        im_info.read_excel_df_and_avr_int(input_folder=self.input_folder)
+        im_info.input_folder = self.input_folder
+        im_info.set_excel_arrays(excel_arrays)
+        im_info.get_variable(variable_name="avr_intensity")  # Memory-mapped, cheap.
 
         return im_info
 
@@ -212,15 +233,25 @@ class OutputDataLoaderMultiThread:
         start_time = time.time()  # Start timer.
 
         # with self.output:
-        # consider ProcessPoolExecutor() for CPU heavy performance instead of ThreadPoolExecutor
-        with concurrent.futures.ThreadPoolExecutor() as executor:
+        # Parsing the Excel files is CPU-bound Python holding the GIL, so it runs in
+        # worker processes; only the file names and the parsed arrays are pickled.
+        # Spawned rather than forked: forking after a Numba parallel kernel has run
+        # (e.g., from the analysis panel) leaves the interpreter hanging at exit.
+        list_image = self.list_all_image_object.get_list_of_image()
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=self.max_workers or os.cpu_count(),
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as executor:
+            # Map each future to the index of its image with respect to list_image.
             futures = {
-                executor.submit(self.process_data, image): image
-                for image, include in zip(
-                    self.list_all_image_object.get_list_of_image(),
-                    self.progress_checklist,
-                )
-                if not include
+                executor.submit(
+                    _parse_excel_arrays,
+                    image.key,
+                    image.associated_files,
+                    self.input_folder,
+                ): index
+                for index, image in enumerate(list_image)
+                if not self.progress_checklist[index]
             }
 
             for future in concurrent.futures.as_completed(futures):
@@ -229,26 +260,21 @@ class OutputDataLoaderMultiThread:
                     print(f"{self.GREEN}Process stopped.{self.RESET}")
                     break
 
-                result = future.result()
-
-                # Get the index of image to be processed with respect to list_image.
-                assert isinstance(
-                    result, type(self.list_all_image_object.get_list_of_image()[0])
-                ), "different type error RawDataLoaderMultiThread class"
-                index = self.list_all_image_object.get_list_of_image().index(result)
-                self.progress_checklist[index] = True
+                index = futures[future]
+                result = self.process_data(list_image[index], future.result())
+                self.progress_checklist[index] = 1
+                self.num_loaded += 1
 
                 # Update progress bar.
-                percentage = int(
-                    sum(self.progress_checklist) / self.total_iterations * 100
-                )
+                percentage = int(self.num_loaded / self.total_iterations * 100)
                 self.progress.value = percentage
                 self.progress_label.value = f"{percentage}%"
                 print(
-                    f"{self.GREEN}Processed step {sum(self.progress_checklist)} / {self.total_iterations}{self.RESET}: {result.key}"
+                    f"{self.GREEN}Processed step {self.num_loaded} / {self.total_iterations}{self.RESET}: {result.key}"
                 )
 
         if not self.stop_flag.is_set():
+            self.list_all_image_object.consolidate()
             end_time = time.time()  # End timer.
             elapsed_time = end_time - start_time
             print(
@@ -268,11 +294,11 @@ class OutputDataLoaderMultiThread:
         Start button callback.
         """
 
-        if sum(self.progress_checklist) >= self.total_iterations:  # If completed.
+        if self.num_loaded >= self.total_iterations:  # If completed.
             # print("completed previously")
             return
 
-        if self.stop_flag.is_set() and sum(self.progress_checklist) > 0:  # If stopped.
+        if self.stop_flag.is_set() and self.num_loaded > 0:  # If stopped.
             # print("stopped previously")
             threading.Thread(target=self.long_process).start()
             return
@@ -1,3 +1,5 @@
+import os
+
 from ..utils import filename_utils
 
 
@@ -13,7 +15,10 @@ class ImfcsScreenerLogic:
     """
 
     grouped_files: dict  # Dictionary with keys for basename and value with list of associated files.
-    keys: list  # List of basename.
+    keys: tuple  # Ordered basenames.
+    key_to_index: dict  # Position of each basename in keys.
+    sorted_filenames: dict  # Useful filenames of each basename, filled on demand.
+    avr_paths: dict  # Path to the _AVR.tif file of each basename, filled on demand.
     input_path: str  # Path to input folder.
 
     def __init__(self, input_path, loaded_group_files: dict = None):
@@ -21,19 +26,22 @@ class ImfcsScreenerLogic:
             self.grouped_files = filename_utils.get_input_files(input_path=input_path)
         else:
             self.grouped_files = loaded_group_files
-        self.keys = list(self.grouped_files.keys())
+        self.keys = tuple(self.grouped_files.keys())
+        self.key_to_index = {key: i for i, key in enumerate(self.keys)}
+        self.sorted_filenames = {}
+        self.avr_paths = {}
         self.input_path = input_path
 
     def get_next_key(self, current_key) -> str:
         """Return the next key in the list."""
-        current_index = self.keys.index(current_key)
+        current_index = self.key_to_index[current_key]
         if current_index < len(self.keys) - 1:
             return self.keys[current_index + 1]
         return current_key
 
     def get_previous_key(self, current_key) -> str:
         """Return the previous key in the list."""
-        current_index = self.keys.index(current_key)
+        current_index = self.key_to_index[current_key]
         if current_index > 0:
             return self.keys[current_index - 1]
         return current_key
@@ -43,8 +51,27 @@ class ImfcsScreenerLogic:
         return self.grouped_files[key]
 
     def get_intensity_excel_filename(self, key) -> list[str]:
-        associated_files = self.get_files_for_key(key)
-        return filename_utils.get_sorted_useful_filenames(input_list=associated_files)
+        # The files of a key do not change, sort them once per key.
+        sorted_filenames = self.sorted_filenames.get(key)
+        if sorted_filenames is None:
+            associated_files = self.get_files_for_key(key)
+            sorted_filenames = filename_utils.get_sorted_useful_filenames(
+                input_list=associated_files
+            )
+            self.sorted_filenames[key] = sorted_filenames
+        return sorted_filenames
+
+    def get_avr_path(self, key) -> str:
+        """Return the path to the ``_AVR.tif`` file of a key."""
+        path_avr = self.avr_paths.get(key)
+        if path_avr is None:
+            to_be_process_fn = self.get_intensity_excel_filename(key)
+            assert to_be_process_fn and to_be_process_fn[0].endswith(
+                "_AVR.tif"
+            ), f"{key} no file with _AVR.tif suffix"
+            path_avr = os.path.join(self.input_path, to_be_process_fn[0])
+            self.avr_paths[key] = path_avr
+        return path_avr
 
     def get_input_path(self):
         return self.input_path
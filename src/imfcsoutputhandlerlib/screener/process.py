@@ -1,9 +1,10 @@
+import functools
 import os
 
-import tifffile
 from IPython.display import display
 
 from ..core.all_image import AllImage
+from ..io import read_avr_intensity
 from ..visualization import plotter
 from ..visualization.display_analysis import DisplayAnalysis
 from ..visualization.roi_selector import ROISelector
@@ -11,6 +12,12 @@ from .gui import ImfcsScreenerGUI
 from .logic import ImfcsScreenerLogic
 
 
+@functools.lru_cache(maxsize=32)
+def _read_avr_cached(path_avr: str, mtime_ns: int):
+    # mtime_ns only keys the cache, so a rewritten file is read again.
+    return read_avr_intensity(path_avr)
+
+
 class ImfcsScreenerProcess:
     """
     Processing layer connecting logic, GUI, ROI selection, and analysis display.
@@ -28,6 +35,7 @@ class ImfcsScreenerProcess:
     list_all_image: AllImage
     roi_selector: ROISelector
     display_analysis: DisplayAnalysis
+    displayed_image: tuple  # (path, mtime_ns, ROI) shown in selected_image_output.
 
     def __init__(
         self,
@@ -42,26 +50,28 @@ class ImfcsScreenerProcess:
         self.list_all_image = allimage
         self.roi_selector = roi_selector
         self.display_analysis = display_analysis
+        self.displayed_image = None
 
     def display_selected_image(self, key):
-        # tiffile read image everytime function is called. Consider storing value for faster performance at expense of memory.
-        to_be_process_fn = self.logic.get_intensity_excel_filename(key)
+        # Cached per path, navigating back to an image does not read it again.
         output = self.gui.selected_image_output
-        input_path = self.logic.get_input_path()
-
-        assert to_be_process_fn[0].endswith(
-            "_AVR.tif"
-        ), f"{key} no file with _AVR.tif suffix"
-        path_avr = os.path.join(input_path, to_be_process_fn[0])
-
-        avr_intensity = tifffile.imread(path_avr)
+        path_avr = self.logic.get_avr_path(key)
+        mtime_ns = os.stat(path_avr).st_mtime_ns
 
         im = self.list_all_image.get_image_info(key)
         coord = im.get_coordinates()
 
+        # Nothing to redraw if this frame and ROI are already displayed.
+        displayed_image = (path_avr, mtime_ns, coord)
+        if displayed_image == self.displayed_image:
+            return
+
+        avr_intensity = _read_avr_cached(path_avr, mtime_ns)
+
         plotter.plot_selected_image_full_frame(
             output=output, array=avr_intensity, index=0, xy_coordinate=coord
         )
+        self.displayed_image = displayed_image
 
     def set_roi_selection_output(self, key):
 
@@ -71,34 +81,24 @@ class ImfcsScreenerProcess:
         ), "on_roi_selection_toggle_change value is not boolean"
 
         if display_on:
-            to_be_process_fn = self.logic.get_intensity_excel_filename(key)
-            input_path = self.logic.get_input_path()
-
-            assert to_be_process_fn[0].endswith(
-                "_AVR.tif"
-            ), f"{key} no file with _AVR.tif suffix"
+            path_avr = self.logic.get_avr_path(key)
+            avr_intensity = _read_avr_cached(path_avr, os.stat(path_avr).st_mtime_ns)
 
-            path_avr = os.path.join(input_path, to_be_process_fn[0])
-            avr_intensity = tifffile.imread(path_avr)
+            # Looked up once, the ``ImageInfo`` of a key does not change while its
+            # ROI selection is displayed.
+            im = self.list_all_image.get_image_info(key)
 
             def handle_coords(coords):
                 # Store selected coordinate.
-                im = self.list_all_image.get_image_info(key)
                 im.add_coordinates(coordinate=coords)
 
                 # If toggle display analysis is on.
                 if self.gui.display_analysis_toggle_button.value:
-                    current_coordinates = self.list_all_image.get_image_info(
-                        key
-                    ).get_coordinates()
-                    im = self.list_all_image.get_image_info(key)
                     self.display_analysis.plot_analysis(
-                        current_coordinates=current_coordinates, image_info=im
+                        current_coordinates=im.get_coordinates(), image_info=im
                     )
 
-            current_coordinates = self.list_all_image.get_image_info(
-                key
-            ).get_coordinates()
+            current_coordinates = im.get_coordinates()
 
             self.roi_selector.plot_roi_selection(
                 index=0,
@@ -119,24 +119,38 @@ class ImfcsScreenerProcess:
         ), "display_analysis_toggle_button value is not boolean"
 
         if is_display_on:
-            current_coordinates = self.list_all_image.get_image_info(
-                key
-            ).get_coordinates()
             im = self.list_all_image.get_image_info(key)
             self.display_analysis.plot_analysis(
-                current_coordinates=current_coordinates, image_info=im
+                current_coordinates=im.get_coordinates(), image_info=im
             )
 
         else:
             self.display_analysis.kill_plot_analysis()
 
+    def prefetch_selected_image(self, key):
+        """Read the average intensity image of ``key`` into the cache."""
+        try:
+            path_avr = self.logic.get_avr_path(key)
+        except AssertionError:
+            return  # No _AVR.tif for this key, displaying it reports the error.
+        avr_intensity = _read_avr_cached(path_avr, os.stat(path_avr).st_mtime_ns)
+
+        # A memory-mapped TIFF is only read on access, touch the displayed frame
+        # so it is in the page cache by the time the key is shown.
+        avr_intensity[0].max()
+
+    def clear_cache(self):
+        """Drop the cached average intensity images."""
+        _read_avr_cached.cache_clear()
+        self.displayed_image = None
+
     def read_raw_data(self, input):
         input_path = self.logic.get_input_path()
         if input[0].endswith(".tif"):
             path_avr = os.path.join(input_path, input[0])
             print(f"path avr: {path_avr}")
 
-            avr_intensity = tifffile.imread(path_avr)
+            avr_intensity = _read_avr_cached(path_avr, os.stat(path_avr).st_mtime_ns)
             plotter.plot_intensity_projection(
                 array=avr_intensity, index=0, xy_coordinate=[15, 30, 50, 50]
             )
@@ -3,19 +3,17 @@ from collections import defaultdict
 
 
 def get_input_files(input_path: str) -> dict:
-    input_files = []
-
-    for file in os.listdir(input_path):
-        if file.endswith((".tif", ".xlsx")):
-            input_files.append(file)
-
     grouped_files = defaultdict(list)
 
-    for file_name in input_files:
-        base_name = "_".join(
-            file_name.split("_")[:-1]
-        )  # Remove the last suffix starting with "_".
-        grouped_files[base_name].append(file_name)
+    # Single pass over the folder, DirEntry.is_file() needs no extra stat call
+    # on most platforms.
+    with os.scandir(input_path) as entries:
+        for entry in entries:
+            file_name = entry.name
+            if file_name.endswith((".tif", ".xlsx")) and entry.is_file():
+                # Remove the last suffix starting with "_".
+                base_name = file_name.rpartition("_")[0]
+                grouped_files[base_name].append(file_name)
 
     grouped_files = dict(sorted(grouped_files.items()))
 
@@ -23,14 +21,16 @@ def get_input_files(input_path: str) -> dict:
 
 
 def get_sorted_useful_filenames(input_list: list[str]) -> list[str]:
-    # Find usable filename for analysis and sort .tif first followed by .xlsx second.
-    filtered = []
+    # Find usable filename for analysis, .tif first followed by .xlsx second.
+    # Single pass partition instead of filtering then sorting on the suffix.
+    tifs, xlsxs = [], []
     for filename in input_list:
-        if filename.endswith("_AVR.tif") or (
-            filename.endswith(".xlsx") and not filename.endswith("_metadata.xlsx")
-        ):
-            filtered.append(filename)
+        if filename.endswith("_AVR.tif"):
+            tifs.append(filename)
+        elif filename.endswith(".xlsx") and not filename.endswith("_metadata.xlsx"):
+            xlsxs.append(filename)
 
-    sorted_files = sorted(filtered, key=lambda x: (not x.endswith(".tif"), x))
+    tifs.sort()
+    xlsxs.sort()  # No-op for the usual single file per key.
 
-    return sorted_files
+    return tifs + xlsxs
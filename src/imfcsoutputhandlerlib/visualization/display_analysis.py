@@ -29,7 +29,7 @@ class DisplayAnalysis:
             lag=image_info.get_variable("lagtimes"),
             fit=image_info.get_variable("fit1"),
             avr_intensity=image_info.get_variable("avr_intensity"),
-            xy_coordinate=image_info.get_coordinates(),
+            xy_coordinate=current_coordinates,
             fit_res=image_info.get_variable("fit1_results"),
             index=0,
             is_plot_with_fit=True,
@@ -41,7 +41,8 @@ class DisplayAnalysis:
         self._show_output()
 
     def kill_plot_analysis(self):
-        plt.close("all")
+        # The figure of this output is kept by the plotter and redrawn on the next
+        # plot, closing every pyplot figure would also close the ROI selector's.
         with self.output:
             self.output.clear_output()
         self._hide_output()
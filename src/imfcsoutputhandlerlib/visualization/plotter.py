@@ -1,14 +1,27 @@
 import math
+import weakref
 
 import ipywidgets as widgets
 import matplotlib.pyplot as plt
 import numpy as np
 from IPython.display import display
+from matplotlib.collections import LineCollection
 from matplotlib.gridspec import GridSpec, GridSpecFromSubplotSpec
 from matplotlib.patches import Rectangle
 
 from ..analysis.fcs_metrics import calculate_nrmsd, calculate_snr
 
+# Figure, axes and image of each output widget, reused across calls.
+_full_frame_figures = weakref.WeakKeyDictionary()
+
+# Combined analysis figure of each output widget with the inputs it was drawn
+# from, cleared and redrawn per ROI.
+_combined_analysis_figures = weakref.WeakKeyDictionary()
+
+# nRMSD and SNR result arrays of each output widget, reused while the ROI shape
+# does not change.
+_roi_metric_buffers = weakref.WeakKeyDictionary()
+
 
 def plot_selected_image_full_frame(
     output: widgets.Output,
@@ -25,38 +38,52 @@ def plot_selected_image_full_frame(
 
         output.clear_output(wait=True)
 
-        # Get the widget's dimensions in pixels.
-        widget_width = int(output.layout.width.replace("px", ""))
-        widget_height = int(output.layout.height.replace("px", ""))
+        frame = array[index, :, :]
+
+        if output in _full_frame_figures:
+            # Update the existing image instead of building a new figure.
+            fig, ax, im, rect = _full_frame_figures[output]
+            im.set_data(frame)
+            im.set_cmap(cmap)
+            im.autoscale()  # Color limits of the new frame, as imshow would set.
+            height, width = frame.shape
+            im.set_extent((-0.5, width - 0.5, height - 0.5, -0.5))
+            ax.set_xlim(-0.5, width - 0.5)
+            ax.set_ylim(height - 0.5, -0.5)
+        else:
+            # Get the widget's dimensions in pixels.
+            widget_width = int(output.layout.width.replace("px", ""))
+            widget_height = int(output.layout.height.replace("px", ""))
 
-        # Convert widget dimensions to inches for the figure.
-        dpi = 100  # Default DPI
-        fig_width_in = widget_width / dpi
-        fig_height_in = widget_height / dpi
+            # Convert widget dimensions to inches for the figure.
+            dpi = 100  # Default DPI
+            fig_width_in = widget_width / dpi
+            fig_height_in = widget_height / dpi
 
-        # Create a figure with adjusted size.
-        fig = plt.figure(figsize=(fig_width_in, fig_height_in))
+            # Create a figure with adjusted size.
+            fig = plt.figure(figsize=(fig_width_in, fig_height_in))
 
-        # fig = plt.figure(figsize=(3, 3))
-        gs = GridSpec(1, 1, figure=fig)
-        ax = fig.add_subplot(gs[0, 0])
+            # fig = plt.figure(figsize=(3, 3))
+            gs = GridSpec(1, 1, figure=fig)
+            ax = fig.add_subplot(gs[0, 0])
 
-        ax.imshow(array[index, :, :], cmap=cmap)
-        ax.set_title(f"Intensity projection")
-        ax.axis("off")
+            im = ax.imshow(frame, cmap=cmap)
+            ax.set_title(f"Intensity projection")
+            ax.axis("off")
 
-        if xy_coordinate is not None:
+            # ROI outline, moved with set_bounds on later calls.
             rect = Rectangle(
-                (xy_coordinate[0], xy_coordinate[1]),
-                xy_coordinate[2],
-                xy_coordinate[3],
-                linewidth=1,
-                edgecolor="red",
-                facecolor="none",
+                (0, 0), 0, 0, linewidth=1, edgecolor="red", facecolor="none"
             )
             ax.add_patch(rect)
 
-        plt.close(fig)  # Supress interactive notebook line output.
+            plt.close(fig)  # Supress interactive notebook line output.
+            _full_frame_figures[output] = (fig, ax, im, rect)
+
+        if xy_coordinate is not None:
+            rect.set_bounds(*xy_coordinate[:4])
+        rect.set_visible(xy_coordinate is not None)
+
         display(fig)
 
 
@@ -95,16 +122,20 @@ def plot_acfs(
     if axs is None:
         fig, axs = plt.subplots(figsize=(5, 5))
 
-    for n in range(n_dim):
-        for m in range(m_dim):
-            axs.plot(arr_lag[1:], arr_acf[n, m, 1:], color=col_profile[0])
+    # One LineCollection per kind of curve instead of a Line2D per pixel.
+    lag = np.broadcast_to(arr_lag[1:], (n_dim * m_dim, t_dim - 1))
+
+    def _segments(arr):
+        return np.stack((lag, arr[:, :, 1:].reshape(-1, t_dim - 1)), axis=-1)
+
+    axs.add_collection(LineCollection(_segments(arr_acf), colors=col_profile[0]))
 
     if with_fits and arr_fit is not None:
-        for n in range(n_dim):
-            for m in range(m_dim):
-                axs.plot(
-                    arr_lag[1:], arr_fit[n, m, 1:], color=col_profile[1], alpha=0.3
-                )
+        axs.add_collection(
+            LineCollection(_segments(arr_fit), colors=col_profile[1], alpha=0.3)
+        )
+
+    axs.autoscale_view()
 
     # Add titles, labels, and grid.
     axs.set_title("Autocorrelation Function")
@@ -216,7 +247,8 @@ def plot_histograms_with_heatmaps(
     for i, index in enumerate(indices):
         # Extract the 2D slice.
         heatmap_data = data[:, :, index]
-        flat_data = heatmap_data.flatten()  # Flatten the 2D array for the histogram.
+        # Flatten the 2D array for the histogram, a view when already contiguous.
+        flat_data = heatmap_data.ravel()
 
         # Subplot for combined visualization.
         ax_hist = fig.add_subplot(gs[i // cols, i % cols])  # Grid layout.
@@ -242,7 +274,7 @@ def plot_histograms_with_heatmaps(
         ax_hist.text(
             text_x,
             text_y,
-            f"Mean: {np.mean(heatmap_data):.2f}\nStd Dev: {np.std(heatmap_data):.2f}",
+            f"Mean: {flat_data.mean():.2f}\nStd Dev: {flat_data.std():.2f}",
             transform=ax_hist.transAxes,
             fontsize=10,
             ha="right",
@@ -276,8 +308,8 @@ def plot_two_histograms(
     for i, (ax, data, title, xlabel, ylabel, color, alpha) in enumerate(
         zip([axs1, axs2], [data1, data2], titles, xlabels, ylabels, colors, alphas)
     ):
-        if data.ndim > 1:
-            data = data.flatten()
+        data = np.asarray(data).ravel()
+        mean = data.mean()  # Shared by the mean line and the text box.
 
         ax.hist(
             data,
@@ -289,14 +321,14 @@ def plot_two_histograms(
         )
         y_min, y_max = ax.get_ylim()
 
-        ax.vlines(np.mean(data), y_min, y_max, "red", linestyles="--")
+        ax.vlines(mean, y_min, y_max, "red", linestyles="--")
         ax.set_title(title)
         ax.set_xlabel(xlabel)
         if i == 0:
             ax.set_ylabel(ylabel if not density else "Probability")
 
         # Add a text box with mean ± std dev.
-        textstr = f"Mean ± Std Dev: {np.mean(data):.2f} ± {np.std(data):.2f}"
+        textstr = f"Mean ± Std Dev: {mean:.2f} ± {data.std():.2f}"
         ax.text(
             0.95,
             0.95,
@@ -313,6 +345,92 @@ def plot_two_histograms(
         plt.show()  # Show the figure only if new axes were created.
 
 
+def _is_same_plot_key(key_a: tuple, key_b: tuple) -> bool:
+    (arrays_a, params_a), (arrays_b, params_b) = key_a, key_b
+    return params_a == params_b and all(a is b for a, b in zip(arrays_a, arrays_b))
+
+
+def _plot_combined_analysis_figure(
+    fig: plt.figure,
+    acf_roi: np.array,
+    lag: np.array,
+    fit_roi: np.array,
+    fit_res_roi: np.array,
+    avr_intensity: np.array,
+    xy_coordinate: list[int],
+    index: int,
+    is_plot_with_fit: bool,
+    indices_histogram_pmap: list[int],
+    labels_histogram_pmap: list[str],
+    nrmsd_out: np.array = None,
+    snr_out: np.array = None,
+):
+    # Create a custom grid layout using gridspec.
+    gs = GridSpec(
+        3, 2, figure=fig, wspace=0.1, hspace=0.5
+    )  # Updated to 3 rows for flexibility.
+
+    # Create individual axes.
+    ax1a = fig.add_subplot(gs[0, 0])  # Top-left subplot
+    # ax1b = fig.add_subplot(gs[0, 1])  # Top-right subplot
+    ax3a = fig.add_subplot(gs[2, 0])  # 2nd row left
+    ax3b = fig.add_subplot(gs[2, 1])  # 2nd row right
+
+    # fig.delaxes(ax1b)
+
+    # Calculate nRMSD and SNR.
+    nrmsd = calculate_nrmsd(
+        observed=acf_roi,
+        predicted=fit_roi,
+        N_fit=fit_res_roi[:, :, 1],
+        out=nrmsd_out,
+    )
+
+    snr = calculate_snr(cf=acf_roi, last_lag=6, out=snr_out)
+
+    # Plot individual components.
+    plot_acfs(
+        arr_acf=acf_roi,
+        arr_lag=lag,
+        arr_fit=fit_roi,
+        with_fits=is_plot_with_fit,
+        axs=ax1a,
+    )
+
+    plot_intensity_projection(
+        array=avr_intensity,
+        index=index,
+        cmap="gray",
+        xy_coordinate=xy_coordinate,
+        gs=gs[0, 1],
+        fig=fig,
+    )
+
+    plot_histograms_with_heatmaps(
+        data=fit_res_roi,
+        indices=indices_histogram_pmap,  # [1, 2, 12]
+        labels=labels_histogram_pmap,  # ["N", "D", "chi square"]
+        gs=gs[1, :],
+        fig=fig,
+    )
+    plot_two_histograms(
+        data1=nrmsd,
+        data2=snr,
+        bins=30,
+        titles=("nRMSD", "SNR"),
+        xlabels=("", ""),
+        ylabels=("Frequency", "Frequency"),
+        colors=("#FFC107", "#FFC107"),
+        alphas=(0.7, 0.7),
+        density=True,
+        figsize=(12, 3),
+        axs1=ax3a,
+        axs2=ax3b,
+    )
+
+    return fig
+
+
 def plot_combined_analysis_imfcs(
     fig: plt.figure,
     gs: GridSpec,
@@ -329,10 +447,32 @@ def plot_combined_analysis_imfcs(
     output: widgets.Output = None,
 ):
 
+    def get_panels():
+        # ROI views (x, y, width, height), shared by every panel. Sliced inside
+        # the output context, so a missing ROI is reported in the output widget.
+        roi = (
+            slice(xy_coordinate[1], xy_coordinate[1] + xy_coordinate[3]),
+            slice(xy_coordinate[0], xy_coordinate[0] + xy_coordinate[2]),
+        )
+        return dict(
+            acf_roi=acf[roi],
+            lag=lag,
+            fit_roi=fit[roi],
+            fit_res_roi=fit_res[roi],
+            avr_intensity=avr_intensity,
+            xy_coordinate=xy_coordinate,
+            index=index,
+            is_plot_with_fit=is_plot_with_fit,
+            indices_histogram_pmap=indices_histogram_pmap,
+            labels_histogram_pmap=labels_histogram_pmap,
+        )
+
     if output is not None:
         with output:
             output.clear_output(wait=True)
 
+            panels = get_panels()
+
             # Get the widget's dimensions in pixels.
             widget_width = int(output.layout.width.replace("px", ""))
             widget_height = int(output.layout.height.replace("px", ""))
@@ -342,193 +482,49 @@ def plot_combined_analysis_imfcs(
             fig_width_in = widget_width / dpi
             fig_height_in = widget_height / dpi
 
-            # Create a custom grid layout using gridspec.
-            fig = plt.figure(figsize=(fig_width_in, fig_height_in))
-            gs = GridSpec(
-                3, 2, figure=fig, wspace=0.1, hspace=0.5
-            )  # Updated to 3 rows for flexibility.
-
-            # Create individual axes.
-            ax1a = fig.add_subplot(gs[0, 0])  # Top-left subplot
-            # ax1b = fig.add_subplot(gs[0, 1])  # Top-right subplot
-            ax3a = fig.add_subplot(gs[2, 0])  # 2nd row left
-            ax3b = fig.add_subplot(gs[2, 1])  # 2nd row right
-
-            # fig.delaxes(ax1b)
-
-            # Calculate nRMSD and SNR.
-            nrmsd = calculate_nrmsd(
-                observed=acf[
-                    xy_coordinate[1] : xy_coordinate[1] + xy_coordinate[3],
-                    xy_coordinate[0] : xy_coordinate[0] + xy_coordinate[2],
-                    :,
-                ],
-                predicted=fit[
-                    xy_coordinate[1] : xy_coordinate[1] + xy_coordinate[3],
-                    xy_coordinate[0] : xy_coordinate[0] + xy_coordinate[2],
-                    :,
-                ],
-                N_fit=fit_res[
-                    xy_coordinate[1] : xy_coordinate[1] + xy_coordinate[3],
-                    xy_coordinate[0] : xy_coordinate[0] + xy_coordinate[2],
-                    1,
-                ],
-            )
-
-            snr = calculate_snr(
-                cf=acf[
-                    xy_coordinate[1] : xy_coordinate[1] + xy_coordinate[3],
-                    xy_coordinate[0] : xy_coordinate[0] + xy_coordinate[2],
-                    :,
-                ],
-                last_lag=6,
+            # Inputs of the figure, the arrays are compared by identity.
+            plot_key = (
+                (acf, lag, fit, fit_res, avr_intensity),
+                (
+                    tuple(xy_coordinate),
+                    index,
+                    is_plot_with_fit,
+                    tuple(indices_histogram_pmap),
+                    tuple(labels_histogram_pmap),
+                    fig_width_in,
+                    fig_height_in,
+                ),
             )
 
-            # Plot individual components.
-            plot_acfs(
-                arr_acf=acf[
-                    xy_coordinate[1] : xy_coordinate[1] + xy_coordinate[3],
-                    xy_coordinate[0] : xy_coordinate[0] + xy_coordinate[2],
-                    :,
-                ],
-                arr_lag=lag,
-                arr_fit=fit[
-                    xy_coordinate[1] : xy_coordinate[1] + xy_coordinate[3],
-                    xy_coordinate[0] : xy_coordinate[0] + xy_coordinate[2],
-                    :,
-                ],
-                with_fits=is_plot_with_fit,
-                axs=ax1a,
-            )
-
-            plot_intensity_projection(
-                array=avr_intensity,
-                index=index,
-                cmap="gray",
-                xy_coordinate=xy_coordinate,
-                gs=gs[0, 1],
-                fig=fig,
-            )
+            # Redraw into the figure of this output instead of allocating one
+            # per ROI update.
+            fig, last_key = _combined_analysis_figures.get(output, (None, None))
+            if last_key is not None and _is_same_plot_key(last_key, plot_key):
+                display(fig)  # ROI not moved, show the figure already drawn.
+                return
+
+            if fig is None:
+                fig = plt.figure(figsize=(fig_width_in, fig_height_in))
+                plt.close(fig)  # supress interactive notebook line output
+            else:
+                fig.clf()
+                fig.set_size_inches(fig_width_in, fig_height_in)
+
+            roi_shape = panels["acf_roi"].shape[:-1]
+            buffers = _roi_metric_buffers.get(output)
+            if buffers is None or buffers[0].shape != roi_shape:
+                buffers = (
+                    np.empty(roi_shape, dtype=np.float32),
+                    np.empty(roi_shape, dtype=np.float32),
+                )
+                _roi_metric_buffers[output] = buffers
 
-            plot_histograms_with_heatmaps(
-                data=fit_res[
-                    xy_coordinate[1] : xy_coordinate[1] + xy_coordinate[3],
-                    xy_coordinate[0] : xy_coordinate[0] + xy_coordinate[2],
-                    :,
-                ],
-                indices=indices_histogram_pmap,  # [1, 2, 12]
-                labels=labels_histogram_pmap,  # ["N", "D", "chi square"]
-                gs=gs[1, :],
-                fig=fig,
-            )
-            plot_two_histograms(
-                data1=nrmsd,
-                data2=snr,
-                bins=30,
-                titles=("nRMSD", "SNR"),
-                xlabels=("", ""),
-                ylabels=("Frequency", "Frequency"),
-                colors=("#FFC107", "#FFC107"),
-                alphas=(0.7, 0.7),
-                density=True,
-                figsize=(12, 3),
-                axs1=ax3a,
-                axs2=ax3b,
+            _plot_combined_analysis_figure(
+                fig=fig, nrmsd_out=buffers[0], snr_out=buffers[1], **panels
             )
-            plt.close(fig)  # supress interactive notebook line output
+            _combined_analysis_figures[output] = (fig, plot_key)
             display(fig)
 
     else:
-        # Create a custom grid layout using gridspec.
         fig = plt.figure(figsize=(14, 12))
-        gs = GridSpec(
-            3, 2, figure=fig, wspace=0.1, hspace=0.5
-        )  # Updated to 3 rows for flexibility.
-
-        # Create individual axes
-        ax1a = fig.add_subplot(gs[0, 0])  # Top-left subplot
-        # ax1b = fig.add_subplot(gs[0, 1])  # Top-right subplot
-        ax3a = fig.add_subplot(gs[2, 0])  # 2nd row left
-        ax3b = fig.add_subplot(gs[2, 1])  # 2nd row right
-
-        # fig.delaxes(ax1b)
-
-        # Calculate nRMSD and SNR.
-        nrmsd = calculate_nrmsd(
-            observed=acf[
-                xy_coordinate[1] : xy_coordinate[1] + xy_coordinate[3],
-                xy_coordinate[0] : xy_coordinate[0] + xy_coordinate[2],
-                :,
-            ],
-            predicted=fit[
-                xy_coordinate[1] : xy_coordinate[1] + xy_coordinate[3],
-                xy_coordinate[0] : xy_coordinate[0] + xy_coordinate[2],
-                :,
-            ],
-            N_fit=fit_res[
-                xy_coordinate[1] : xy_coordinate[1] + xy_coordinate[3],
-                xy_coordinate[0] : xy_coordinate[0] + xy_coordinate[2],
-                1,
-            ],
-        )
-
-        snr = calculate_snr(
-            cf=acf[
-                xy_coordinate[1] : xy_coordinate[1] + xy_coordinate[3],
-                xy_coordinate[0] : xy_coordinate[0] + xy_coordinate[2],
-                :,
-            ],
-            last_lag=6,
-        )
-
-        # Plot individual components.
-        plot_acfs(
-            arr_acf=acf[
-                xy_coordinate[1] : xy_coordinate[1] + xy_coordinate[3],
-                xy_coordinate[0] : xy_coordinate[0] + xy_coordinate[2],
-                :,
-            ],
-            arr_lag=lag,
-            arr_fit=fit[
-                xy_coordinate[1] : xy_coordinate[1] + xy_coordinate[3],
-                xy_coordinate[0] : xy_coordinate[0] + xy_coordinate[2],
-                :,
-            ],
-            with_fits=is_plot_with_fit,
-            axs=ax1a,
-        )
-
-        plot_intensity_projection(
-            array=avr_intensity,
-            index=index,
-            cmap="gray",
-            xy_coordinate=xy_coordinate,
-            gs=gs[0, 1],
-            fig=fig,
-        )
-
-        plot_histograms_with_heatmaps(
-            data=fit_res[
-                xy_coordinate[1] : xy_coordinate[1] + xy_coordinate[3],
-                xy_coordinate[0] : xy_coordinate[0] + xy_coordinate[2],
-                :,
-            ],
-            indices=indices_histogram_pmap,  # [1, 2, 12]
-            labels=labels_histogram_pmap,  # ["N", "D", "chi square"]
-            gs=gs[1, :],
-            fig=fig,
-        )
-        plot_two_histograms(
-            data1=nrmsd,
-            data2=snr,
-            bins=30,
-            titles=("nRMSD", "SNR"),
-            xlabels=("", ""),
-            ylabels=("Frequency", "Frequency"),
-            colors=("#FFC107", "#FFC107"),
-            alphas=(0.7, 0.7),
-            density=True,
-            figsize=(12, 3),
-            axs1=ax3a,
-            axs2=ax3b,
-        )
+        _plot_combined_analysis_figure(fig=fig, **get_panels())
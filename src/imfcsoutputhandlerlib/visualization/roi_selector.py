@@ -22,6 +22,7 @@ class ROISelector:
         """
         self.fig = None
         self.ax = None
+        self.im = None
         self.rectangle_selector = None
         self.coordinates_label = widgets.Label(value="No selection made yet.")
         self.output = output
@@ -64,7 +65,22 @@ class ROISelector:
         else:
             self.coordinates_label.value = f"ROI Selected: {current_coordinates}."
 
-        plt.close("all")
+        frame = array[index, :, :]
+
+        if self.fig is not None:
+            # The canvas is already displayed, swap the image and drop the old
+            # rectangle instead of building a new figure and selector.
+            self.im.set_data(frame)
+            self.im.set_cmap(cmap)
+            self.im.autoscale()  # Color limits of the new frame, as imshow would set.
+            height, width = frame.shape
+            self.im.set_extent((-0.5, width - 0.5, height - 0.5, -0.5))
+            self.ax.set_xlim(-0.5, width - 0.5)
+            self.ax.set_ylim(height - 0.5, -0.5)
+            self.rectangle_selector.clear()
+            self.fig.canvas.draw_idle()
+            self._show_output()
+            return
 
         with self.output:
             self.output.clear_output(wait=True)
@@ -79,7 +95,7 @@ class ROISelector:
             fig_height_in = widget_height / dpi
 
             self.fig, self.ax = plt.subplots(figsize=(fig_width_in, fig_height_in))
-            self.ax.imshow(array[index, :, :], cmap=cmap)
+            self.im = self.ax.imshow(frame, cmap=cmap)
             self.ax.set_title("Drag to select a region-of-interest (ROI)")
 
             # Initialize RectangleSelector.
@@ -90,6 +106,7 @@ class ROISelector:
                 button=[1],
                 minspanx=5,
                 minspany=5,
+                useblit=True,  # Redraw only the rectangle while dragging.
             )  # Minimum size for the rectangle.
 
             # Display.
@@ -97,10 +114,19 @@ class ROISelector:
 
         self._show_output()
 
-    def kill_plot_roi_selection(self):
-        plt.close("all")
+    def clear_plot_roi_selection(self):
+        """Remove the ROI selection plot, the next plot builds a new figure."""
+        if self.fig is not None:
+            plt.close(self.fig)  # Only this selector's figure.
+        self.fig = None
+        self.ax = None
+        self.im = None
+        self.rectangle_selector = None
         with self.output:
             self.output.clear_output()
+
+    def kill_plot_roi_selection(self):
+        self.clear_plot_roi_selection()
         self._hide_output()
 
     def _show_output(self):
@@ -0,0 +1,79 @@
+import numpy as np
+import pandas as pd
+import pytest
+import tifffile
+
+from imfcsoutputhandlerlib.core.all_image import AllImage
+from imfcsoutputhandlerlib.utils import filename_utils
+
+WIDTH = 4
+HEIGHT = 3
+NUM_LAG = 8
+NUM_PARAM = 13
+KEYS = ("cellA", "cellB", "cellC")
+
+
+def write_imfcs_output(folder, key, seed=0):
+    """
+    Write a small ImFCS output (``<key>_out.xlsx`` and ``<key>_AVR.tif``) with
+    random data to ``folder``.
+    """
+    rng = np.random.default_rng(seed)
+    num_pixel = WIDTH * HEIGHT
+
+    with pd.ExcelWriter(folder / f"{key}_out.xlsx") as writer:
+
+        def write_sheet(rows, sheet_name):
+            pd.DataFrame(rows).to_excel(
+                writer, sheet_name=sheet_name, header=False, index=False
+            )
+
+        write_sheet(
+            [
+                ["Image width", WIDTH],
+                ["Image height", HEIGHT],
+                ["Binning X", 1],
+                ["Binning Y", 1],
+                ["Overlap", "false"],
+            ],
+            "Panel Parameters",
+        )
+        lagtimes = np.r_[0, np.logspace(-5, -1, NUM_LAG - 1)]
+        write_sheet(
+            [["index", "lagtime"]] + [[i, lag] for i, lag in enumerate(lagtimes)],
+            "lagtime",
+        )
+        for sheet_name in ("ACF1", "SD (ACF1)", "Fit functions (ACF1)"):
+            data = rng.random((num_pixel, NUM_LAG))
+            write_sheet(
+                [[f"p{i}"] + list(data[i]) for i in range(num_pixel)], sheet_name
+            )
+
+        # Header cells are mostly strings, the last one is a number.
+        header = ["pixel", "fitted"] + [f"param{k}" for k in range(2, NUM_PARAM)]
+        rows = [header + [NUM_PARAM]]
+        for i in range(num_pixel):
+            fitted = "true" if i % 2 else "false"
+            rows.append([f"p{i}", fitted] + list(rng.random(NUM_PARAM - 1)))
+        write_sheet(rows, "Fit Parameters (ACF1)")
+
+    avr = rng.integers(0, 1000, (2, HEIGHT, WIDTH)).astype(np.uint16)
+    tifffile.imwrite(folder / f"{key}_AVR.tif", avr)
+
+
+@pytest.fixture
+def write_output():
+    return write_imfcs_output
+
+
+@pytest.fixture
+def input_folder(tmp_path):
+    for seed, key in enumerate(KEYS):
+        write_imfcs_output(tmp_path, key, seed=seed)
+    return tmp_path
+
+
+@pytest.fixture
+def all_image(input_folder):
+    grouped_files = filename_utils.get_input_files(str(input_folder))
+    return AllImage("test", grouped_files, input_folder=str(input_folder))
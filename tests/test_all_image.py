@@ -0,0 +1,42 @@
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+
+from imfcsoutputhandlerlib.core.all_image import AllImage
+from imfcsoutputhandlerlib.core.image_info import pickle_arrays
+
+
+def test_save_omits_arrays(all_image, tmp_path):
+    all_image.preload(input_folder=all_image.get_image_info_from_list(0).input_folder)
+    all_image.save(tmp_path / "all_image.pkl")
+
+    loaded = AllImage.from_pickle(tmp_path / "all_image.pkl")
+
+    im = loaded.get_image_info_from_list(0)
+    assert im._acf1 is None
+    assert im._avr_intensity is None
+
+
+def test_save_with_arrays_keeps_arrays(all_image, tmp_path):
+    all_image.preload(input_folder=all_image.get_image_info_from_list(0).input_folder)
+    all_image.save_with_arrays(tmp_path / "all_image.pkl")
+
+    loaded = AllImage.from_pickle(tmp_path / "all_image.pkl")
+
+    im = loaded.get_image_info_from_list(0)
+    assert im._acf1 is not None
+    assert im._avr_intensity is not None
+    assert not pickle_arrays.get()
+
+
+def test_pickle_arrays_is_local_to_the_saving_thread(all_image):
+    im = all_image.get_image_info_from_list(0)
+    im.read_excel_df_and_avr_int(input_folder=im.input_folder)
+
+    token = pickle_arrays.set(True)
+    try:
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            state = executor.submit(pickle.dumps, im).result()
+    finally:
+        pickle_arrays.reset(token)
+
+    assert pickle.loads(state)._acf1 is None
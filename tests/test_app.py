@@ -0,0 +1,52 @@
+import asyncio
+from unittest import mock
+
+from imfcsoutputhandlerlib.screener.app import ImfcsScreenerApp
+
+
+def make_app():
+    # Only the navigation state, without building the widgets.
+    app = ImfcsScreenerApp.__new__(ImfcsScreenerApp)
+    app.nav_token = 0
+    app.process = mock.Mock()
+    app.error_manager = mock.Mock()
+    app.prefetch_neighbor_images = mock.Mock()
+    return app
+
+
+def run_clicks(app, keys):
+    async def click():
+        for key in keys:
+            app.schedule_image_update(key)
+        await asyncio.sleep(app.NAV_DEBOUNCE_S * 4)
+
+    asyncio.run(click())
+
+
+def test_rapid_updates_render_only_the_last_key():
+    app = make_app()
+
+    run_clicks(app, ["cellA", "cellB", "cellC"])
+
+    app.process.display_selected_image.assert_called_once_with(key="cellC")
+    app.process.set_roi_selection_output.assert_called_once_with(key="cellC")
+
+
+def test_update_without_event_loop_renders_now():
+    app = make_app()
+
+    app.schedule_image_update("cellA")
+
+    app.process.display_selected_image.assert_called_once_with(key="cellA")
+
+
+def test_deferred_update_error_is_displayed():
+    app = make_app()
+    app.process.display_selected_image.side_effect = AssertionError("no .tif file")
+
+    run_clicks(app, ["cellA"])
+
+    app.error_manager.display_error.assert_called_once()
+    (message,), _ = app.error_manager.display_error.call_args
+    assert "cellA" in message
+    assert "no .tif file" in message
@@ -0,0 +1,114 @@
+import os
+
+import numpy as np
+import pytest
+
+from imfcsoutputhandlerlib.core.image_info import ImageInfo
+from imfcsoutputhandlerlib.io.array_cache import (
+    get_cache_path,
+    read_array_cache,
+    write_array_cache,
+)
+
+NAMES = ("a", "b")
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "source.xlsx"
+    path.write_bytes(b"source")
+    return str(path)
+
+
+@pytest.fixture
+def arrays():
+    return {"a": np.arange(6, dtype=np.float32).reshape(2, 3), "b": np.array("x")}
+
+
+def test_cache_hit(source, arrays):
+    write_array_cache(source, arrays)
+
+    cached = read_array_cache(source, NAMES)
+
+    assert cached.keys() == arrays.keys()
+    for name, value in arrays.items():
+        assert cached[name].dtype == value.dtype
+        np.testing.assert_array_equal(cached[name], value)
+
+
+def test_cache_miss_without_cache(source):
+    assert read_array_cache(source, NAMES) is None
+
+
+def test_cache_miss_with_missing_name(source, arrays):
+    write_array_cache(source, arrays)
+
+    assert read_array_cache(source, NAMES + ("c",)) is None
+
+
+def test_cache_miss_after_source_changed(source, arrays):
+    write_array_cache(source, arrays)
+    with open(source, "ab") as f:
+        f.write(b" modified")
+
+    assert read_array_cache(source, NAMES) is None
+
+
+@pytest.mark.parametrize(
+    "content", [b"", b"not a zip file", b"PK\x03\x04 truncated"], ids=repr
+)
+def test_corrupt_cache_is_a_miss(source, content):
+    with open(get_cache_path(source), "wb") as f:
+        f.write(content)
+
+    assert read_array_cache(source, NAMES) is None
+
+
+def test_truncated_cache_is_a_miss(source, arrays):
+    write_array_cache(source, arrays)
+    path_cache = get_cache_path(source)
+    size = os.path.getsize(path_cache)
+    with open(path_cache, "r+b") as f:
+        f.truncate(size // 2)
+
+    assert read_array_cache(source, NAMES) is None
+
+
+def test_write_leaves_no_temporary_file(source, arrays):
+    write_array_cache(source, arrays)
+
+    assert sorted(os.listdir(os.path.dirname(source))) == [
+        "source.xlsx",
+        "source.xlsx.cache.npz",
+    ]
+
+
+def test_write_failure_is_ignored(tmp_path, arrays):
+    # Source missing, so the cache cannot be written.
+    write_array_cache(str(tmp_path / "missing.xlsx"), arrays)
+
+    assert os.listdir(tmp_path) == []
+
+
+def test_image_info_from_cache_matches_fresh_parse(input_folder):
+    def load():
+        im = ImageInfo(
+            key="cellA",
+            associated_files=["cellA_AVR.tif", "cellA_out.xlsx"],
+            input_folder=str(input_folder),
+        )
+        return im.get_excel_arrays()
+
+    path_cache = get_cache_path(str(input_folder / "cellA_out.xlsx"))
+    fresh = load()
+    assert os.path.exists(path_cache)
+    cached = load()
+
+    assert fresh["fit1_param"] == cached["fit1_param"]
+    assert [type(value) for value in fresh["fit1_param"]] == [
+        type(value) for value in cached["fit1_param"]
+    ]
+    assert not all(isinstance(value, str) for value in cached["fit1_param"])
+    for attr in ("lagtimes", "acf1", "sd1", "fit1", "fit1_results"):
+        assert cached[attr].dtype == fresh[attr].dtype
+        np.testing.assert_array_equal(cached[attr], fresh[attr])
@@ -0,0 +1,112 @@
+import os
+
+import numpy as np
+import pytest
+
+from imfcsoutputhandlerlib.core import image_queries
+from imfcsoutputhandlerlib.io.array_cache import get_cache_path
+
+
+def test_aggregate_is_cached(all_image):
+    acf = image_queries.get_cfs_related(all_image, "acf1")
+
+    assert image_queries.get_cfs_related(all_image, "acf1") is acf
+    assert not acf.flags.writeable
+    for cell_index, im in enumerate(all_image.get_list_of_image()):
+        np.testing.assert_array_equal(acf[cell_index], im.acf1)
+
+
+def test_aggregate_is_rebuilt_after_set_excel_arrays(all_image):
+    acf = image_queries.get_cfs_related(all_image, "acf1")
+    im = all_image.get_image_info_from_list(1)
+    arrays = im.get_excel_arrays()
+    arrays["acf1"] = arrays["acf1"] + 1
+
+    im.set_excel_arrays(arrays)
+
+    acf_new = image_queries.get_cfs_related(all_image, "acf1")
+    assert acf_new is not acf
+    np.testing.assert_array_equal(acf_new[1], arrays["acf1"])
+
+
+def test_aggregate_is_rebuilt_after_reload(all_image, input_folder, write_output):
+    acf = image_queries.get_cfs_related(all_image, "acf1")
+    im = all_image.get_image_info_from_list(0)
+    path_excel = input_folder / f"{im.key}_out.xlsx"
+    os.remove(get_cache_path(str(path_excel)))
+    write_output(input_folder, im.key, seed=100)
+
+    im._load_excel(force=True)
+
+    acf_new = image_queries.get_cfs_related(all_image, "acf1")
+    assert not np.array_equal(acf_new[0], acf[0])
+    np.testing.assert_array_equal(acf_new[0], im.acf1)
+
+
+def test_consolidate_shares_read_only_views(all_image):
+    all_image.consolidate()
+
+    acf = image_queries.get_cfs_related(all_image, "acf1")
+    for cell_index, im in enumerate(all_image.get_list_of_image()):
+        assert np.shares_memory(acf, im.acf1)
+        assert not im.acf1.flags.writeable
+        np.testing.assert_array_equal(acf[cell_index], im.acf1)
+    assert not acf.flags.writeable
+    with pytest.raises(ValueError):
+        all_image.get_image_info_from_list(0).acf1[0, 0, 0] = 0
+
+
+def test_consolidate_is_invalidated_by_reload(all_image):
+    all_image.consolidate()
+    im = all_image.get_image_info_from_list(2)
+    arrays = im.get_excel_arrays()
+    arrays["fit1"] = np.zeros_like(arrays["fit1"])
+
+    im.set_excel_arrays(arrays)
+
+    fit = image_queries.get_cfs_related(all_image, "fit1")
+    assert not fit[2].any()
+    assert fit[0].any()
+
+
+def test_mmap_is_reattached(all_image, tmp_path):
+    mmap_path = str(tmp_path / "fit1.npy")
+    fit = image_queries.get_cfs_related(all_image, "fit1", mmap_path=mmap_path)
+
+    reattached = image_queries.get_cfs_related(all_image, "fit1", mmap_path=mmap_path)
+
+    assert isinstance(reattached, np.memmap)
+    assert not reattached.flags.writeable
+    np.testing.assert_array_equal(reattached, fit)
+    with open(mmap_path + ".var") as f:
+        assert f.read() == "fit1"
+
+
+def test_mmap_of_another_variable_raises(all_image, tmp_path):
+    mmap_path = str(tmp_path / "cfs.npy")
+    image_queries.get_cfs_related(all_image, "fit1", mmap_path=mmap_path)
+
+    with pytest.raises(ValueError, match="holds 'fit1', not 'sd1'"):
+        image_queries.get_cfs_related(all_image, "sd1", mmap_path=mmap_path)
+    with pytest.raises(ValueError, match="not 'avr_intensity'"):
+        image_queries.get_array_intensity(all_image, mmap_path=mmap_path)
+
+
+def test_mmap_is_rebuilt_when_cells_change(all_image, tmp_path):
+    mmap_path = str(tmp_path / "acf1.npy")
+    image_queries.get_cfs_related(all_image, "acf1", mmap_path=mmap_path)
+    all_image.list_image_info_object = all_image.get_list_of_image()[:2]
+
+    acf = image_queries.get_cfs_related(all_image, "acf1", mmap_path=mmap_path)
+
+    assert acf.shape[0] == 2
+    np.testing.assert_array_equal(acf[1], all_image.get_image_info_from_list(1).acf1)
+
+
+def test_incomplete_mmap_is_rebuilt(all_image, tmp_path):
+    mmap_path = str(tmp_path / "acf1.npy")
+    np.save(mmap_path, np.zeros((3, 1)))  # No variable name, e.g. interrupted.
+
+    acf = image_queries.get_cfs_related(all_image, "acf1", mmap_path=mmap_path)
+
+    np.testing.assert_array_equal(acf[0], all_image.get_image_info_from_list(0).acf1)